@@ -0,0 +1,331 @@
+"""Concurrent bulk writes with a per-item outcome."""
+
+import hashlib
+import json
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, NamedTuple, TextIO, TypeVar
+
+from notion_client.errors import APIErrorCode, APIResponseError
+from platformdirs import user_cache_dir
+
+from .client import NotionClientWrapper
+
+T = TypeVar("T")
+
+
+class BulkResult(NamedTuple):
+    """Outcome of one write.
+
+    ``key`` identifies the write: the page ID for updates, or whatever the
+    caller keyed its items by, such as the source row of an imported entry.
+    """
+
+    key: str
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the write succeeded."""
+        return self.error is None
+
+
+class Checkpoint:
+    """Append-only journal of a bulk update, used to resume an interrupted run.
+
+    The journal is a JSON lines file. Its first line holds the plan of the run,
+    i.e. whatever the caller needs to repeat it. Each further line records a
+    completed page ID or the query cursor before which every entry is done.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the checkpoint, loading the journal if it exists."""
+        self.path = path
+        self.plan: dict[str, Any] | None = None
+        self.done: set[str] = set()
+        self.cursor: str | None = None
+        self._file: TextIO | None = None
+        self._load()
+
+    @classmethod
+    def for_job(cls, *key: Any) -> "Checkpoint":
+        """Return the checkpoint of the job identified by JSON-serializable key parts."""
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        checkpoint_dir = Path(user_cache_dir("notion", "notion")) / "checkpoints"
+        return cls(checkpoint_dir / f"{digest[:16]}.jsonl")
+
+    def _load(self) -> None:
+        """Replay the journal, if any."""
+        try:
+            with open(self.path) as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by an interruption
+                continue
+            if not isinstance(record, dict):
+                continue
+            if "plan" in record:
+                self.plan = record["plan"]
+            elif "done" in record:
+                self.done.add(record["done"])
+            elif "cursor" in record:
+                self.cursor = record["cursor"]
+
+    def start(self, plan: dict[str, Any]) -> None:
+        """Begin a new journal for the given plan, discarding any previous one."""
+        self.close()
+        self.plan = plan
+        self.done = set()
+        self.cursor = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w")
+        self._write({"plan": plan})
+
+    def record_done(self, page_id: str) -> None:
+        """Record that a page was updated."""
+        self.done.add(page_id)
+        self._write({"done": page_id})
+
+    def record_cursor(self, cursor: str) -> None:
+        """Record the cursor before which every matching entry was updated."""
+        self.cursor = cursor
+        self._write({"cursor": cursor})
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Append a record and flush it, so it survives the process being killed."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Delete the journal and forget its contents."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+        self.plan = None
+        self.done = set()
+        self.cursor = None
+
+
+class _QueryPage:
+    """A page of query results whose entries are being updated."""
+
+    def __init__(self, next_cursor: str | None) -> None:
+        self.next_cursor = next_cursor
+        self.pending: set[str] = set()
+        self.enumerated = False
+
+
+class BulkUpdater:
+    """Applies writes to many pages concurrently under the client's rate limit.
+
+    Each page succeeds or fails on its own: a failure is recorded with its
+    reason instead of aborting the rest of the batch. Page IDs are consumed
+    lazily, so a stream of entries can be updated while it is still being
+    fetched.
+    """
+
+    def __init__(self, client: NotionClientWrapper, max_workers: int | None = None) -> None:
+        """Initialize the updater, defaulting to the configured max_concurrency."""
+        self.client = client
+        self.max_workers = max(max_workers or client.config.max_concurrency, 1)
+
+    def update_pages(
+        self,
+        page_ids: Iterable[str],
+        properties: dict[str, Any],
+        on_result: Callable[[BulkResult], None] | None = None,
+    ) -> list[BulkResult]:
+        """Apply the same property update to many pages.
+
+        Returns:
+            One result per page, in the order of ``page_ids``
+        """
+        return self.run(
+            page_ids,
+            lambda page_id: self.client.update_page(page_id, properties),
+            on_result,
+        )
+
+    def update_query(
+        self,
+        database_id: str,
+        properties: dict[str, Any],
+        filter_conditions: dict[str, Any] | None = None,
+        limit: int | None = None,
+        checkpoint: Checkpoint | None = None,
+        on_result: Callable[[BulkResult], None] | None = None,
+        predicate: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> list[BulkResult]:
+        """Apply the same property update to every entry matching a database query.
+
+        Entries are updated while later pages of the query are still being fetched.
+        With a ``checkpoint``, completed entries and the query position are
+        journaled, entries it lists as done are skipped and the query resumes
+        from its cursor.
+
+        Args:
+            database_id: ID of the database to query
+            properties: Notion properties to set on every entry
+            filter_conditions: Notion filter selecting the entries
+            limit: Maximum number of entries to update, counting those completed
+                by earlier runs of the checkpoint
+            checkpoint: Journal to resume from and record progress in
+            on_result: Called in the calling thread as each write finishes
+            predicate: Further condition an entry must meet, for filters the API
+                can't evaluate
+
+        Returns:
+            One result per entry, without the updated pages to keep memory flat
+        """
+        done = checkpoint.done if checkpoint else set()
+        pages: deque[_QueryPage] = deque()
+        page_of: dict[str, _QueryPage] = {}
+
+        def advance() -> None:
+            # Move the cursor past leading pages whose entries have all been updated
+            while pages and pages[0].enumerated and not pages[0].pending:
+                page = pages.popleft()
+                if checkpoint and page.next_cursor:
+                    checkpoint.record_cursor(page.next_cursor)
+
+        def page_ids() -> Iterator[str]:
+            remaining = None if limit is None else limit - len(done)
+            responses = self._query_pages(
+                database_id, filter_conditions, checkpoint.cursor if checkpoint else None
+            )
+            for response in responses:
+                page = _QueryPage(response.get("next_cursor"))
+                pages.append(page)
+                for entry in response.get("results", []):
+                    page_id = entry.get("id")
+                    if not page_id or page_id in done:
+                        continue
+                    if predicate and not predicate(entry):
+                        continue
+                    if remaining is not None:
+                        if remaining <= 0:
+                            return
+                        remaining -= 1
+                    page.pending.add(page_id)
+                    page_of[page_id] = page
+                    yield page_id
+                page.enumerated = True
+                advance()
+
+        def record(result: BulkResult) -> None:
+            page = page_of.pop(result.key, None)
+            if result.ok:
+                if checkpoint:
+                    checkpoint.record_done(result.key)
+                if page is not None:
+                    page.pending.discard(result.key)
+                    advance()
+            if on_result:
+                on_result(result)
+
+        return self.run(
+            page_ids(),
+            lambda page_id: self.client.update_page(page_id, properties),
+            record,
+            keep_results=False,
+        )
+
+    def _query_pages(
+        self,
+        database_id: str,
+        filter_conditions: dict[str, Any] | None,
+        start_cursor: str | None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield query responses from a saved cursor, starting over if it was rejected.
+
+        Only the API's validation error for the cursor restarts the query; rate
+        limits and network errors reach the caller so the checkpoint keeps it.
+        """
+        responses = self.client.iter_database_pages(
+            database_id, filter_conditions=filter_conditions, start_cursor=start_cursor
+        )
+        if start_cursor:
+            try:
+                first = next(responses)
+            except StopIteration:
+                return
+            except Exception as e:
+                cause = e.__cause__
+                if not (
+                    isinstance(cause, APIResponseError)
+                    and cause.code == APIErrorCode.ValidationError
+                ):
+                    raise
+                # The cursor can point at an entry the edit moved out of the filter;
+                # the journaled IDs still skip everything that was done
+                responses = self.client.iter_database_pages(
+                    database_id, filter_conditions=filter_conditions
+                )
+            else:
+                yield first
+        yield from responses
+
+    def run(
+        self,
+        items: Iterable[T],
+        func: Callable[[T], dict[str, Any]],
+        on_result: Callable[[BulkResult], None] | None = None,
+        keep_results: bool = True,
+        key: Callable[[T], str] = str,
+    ) -> list[BulkResult]:
+        """Call ``func`` for every item with bounded concurrency.
+
+        Args:
+            items: What to write, usually the IDs of the pages to update
+            func: Performs the write for one item and returns the written page
+            on_result: Called in the calling thread as each write finishes
+            keep_results: Whether the returned results include the written pages
+            key: Returns the key identifying an item in its result
+
+        Returns:
+            One result per item, in the order of ``items``
+        """
+        results: dict[int, BulkResult] = {}
+        pending: dict[Future[dict[str, Any]], tuple[int, str]] = {}
+
+        def collect(done: Iterable[Future[dict[str, Any]]]) -> None:
+            for future in done:
+                index, item_key = pending.pop(future)
+                try:
+                    result = BulkResult(item_key, result=future.result())
+                except Exception as e:
+                    result = BulkResult(item_key, error=str(e))
+                results[index] = result if keep_results else result._replace(result=None)
+                if on_result:
+                    on_result(result)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, item in enumerate(items):
+                # Keep the queue short so an endless stream doesn't pile up in memory
+                if len(pending) >= self.max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending[executor.submit(func, item)] = (index, key(item))
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        return [results[index] for index in sorted(results)]
@@ -0,0 +1,355 @@
+"""On-disk caches for Notion API responses."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_dir
+
+# Notion truncates last_edited_time to the minute, so an edit made in the same
+# minute as a fetch leaves the timestamp unchanged
+TIMESTAMP_PRECISION = 60.0
+
+# Set by the global --refresh option to bypass cached reads for one invocation
+REFRESH_ENV_VAR = "NOTION_CLI_REFRESH"
+
+
+def workspace_cache_dir(token: str | None) -> Path:
+    """Return the directory holding the cached data of an integration token.
+
+    Every token gets its own directory, so switching tokens never serves
+    objects from another workspace.
+    """
+    digest = hashlib.sha256((token or "").encode()).hexdigest()
+    return Path(user_cache_dir("notion", "notion")) / "workspaces" / digest[:16]
+
+
+def _adds_options(values: dict[str, Any], schema: dict[str, Any]) -> bool:
+    """Whether property values written to a page name a select option the schema lacks."""
+    by_id = {prop.get("id"): prop for prop in schema.values() if isinstance(prop, dict)}
+    for name, value in values.items():
+        prop = schema.get(name) or by_id.get(name)
+        if not prop or not isinstance(value, dict):
+            continue
+        kind = prop.get("type")
+        if kind not in ("select", "multi_select"):
+            continue
+        chosen = value.get(kind)
+        options = [chosen] if isinstance(chosen, dict) else chosen or []
+        known = {option.get("name") for option in prop.get(kind, {}).get("options", [])}
+        if any(isinstance(o, dict) and "name" in o and o["name"] not in known for o in options):
+            return True
+    return False
+
+
+def _parse_timestamp(value: str) -> float | None:
+    """Parse an ISO 8601 timestamp from the API into epoch seconds."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+class _SQLiteCache:
+    """Base class for caches stored in a single-table SQLite database.
+
+    Cache errors never propagate: a broken or unwritable cache simply behaves
+    as a miss. While the refresh environment variable is set, entries stored
+    before the cache was opened are ignored, so each object is fetched once
+    and then served from the cache for the rest of the process.
+    """
+
+    schema = ""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the cache, creating the database on first use."""
+        self.path = path
+        self.refresh = bool(os.getenv(REFRESH_ENV_VAR))
+        # Entries stored before this time are treated as missing
+        self.not_before = time.time() if self.refresh else 0.0
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache database in a transaction that is committed on success."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                conn.executescript(self.schema)
+                yield conn
+        finally:
+            conn.close()
+
+
+class BlockCache(_SQLiteCache):
+    """Cache of page block trees, validated by the page's last_edited_time.
+
+    Entries are evicted least recently used first once the stored trees exceed
+    ``max_bytes``.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS blocks ("
+        " page_id TEXT PRIMARY KEY,"
+        " last_edited_time TEXT NOT NULL,"
+        " fetched_at REAL NOT NULL,"
+        " accessed_at REAL NOT NULL,"
+        " size INTEGER NOT NULL,"
+        " data TEXT NOT NULL)"
+    )
+
+    def __init__(self, path: Path | None = None, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initialize the cache, defaulting to the user cache directory."""
+        super().__init__(path or Path(user_cache_dir("notion", "notion")) / "blocks.db")
+        self.max_bytes = max_bytes
+
+    def get(self, page_id: str, last_edited_time: str) -> list[dict[str, Any]] | None:
+        """Return the cached block tree of a page if it is still current."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT last_edited_time, fetched_at, data FROM blocks WHERE page_id = ?",
+                    (page_id,),
+                ).fetchone()
+                if not row or row[0] != last_edited_time or row[1] < self.not_before:
+                    return None
+
+                # Only trust trees fetched after the edit's minute had passed
+                edited_at = _parse_timestamp(last_edited_time)
+                if edited_at is None or row[1] < edited_at + TIMESTAMP_PRECISION:
+                    return None
+
+                conn.execute(
+                    "UPDATE blocks SET accessed_at = ? WHERE page_id = ?",
+                    (time.time(), page_id),
+                )
+                return json.loads(row[2])
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, page_id: str, last_edited_time: str, blocks: list[dict[str, Any]]) -> None:
+        """Store the block tree of a page and evict old entries over the size cap."""
+        if self.max_bytes <= 0:
+            return
+
+        data = json.dumps(blocks)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?, ?, ?)",
+                    (page_id, last_edited_time, now, now, len(data), data),
+                )
+                self._evict(conn)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate(self, page_id: str) -> None:
+        """Drop the cached block tree of a page."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM blocks WHERE page_id = ?", (page_id,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blocks").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = conn.execute("SELECT page_id, size FROM blocks ORDER BY accessed_at").fetchall()
+        for page_id, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM blocks WHERE page_id = ?", (page_id,))
+            total -= size
+
+
+class MetadataCache(_SQLiteCache):
+    """TTL cache of search results and database objects.
+
+    Values are stored as compressed JSON under keys such as ``database:<id>``
+    and ``search:page:<query>``. Writes sent through the API invalidate the
+    entries they may have changed (see ``invalidate_for_write``).
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS metadata ("
+        " key TEXT PRIMARY KEY,"
+        " stored_at REAL NOT NULL,"
+        " data BLOB NOT NULL)"
+    )
+
+    def __init__(self, path: Path | None = None, ttl: float = 300.0) -> None:
+        """Initialize the cache, defaulting to the user cache directory."""
+        super().__init__(path or Path(user_cache_dir("notion", "notion")) / "metadata.db")
+        self.ttl = ttl
+        # Whether this process dropped the page searches and cached none since
+        self._page_searches_dropped = False
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        if self.ttl <= 0:
+            return None
+
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT stored_at, data FROM metadata WHERE key = ?", (key,)
+                ).fetchone()
+            if not row or row[0] < self.not_before or time.time() - row[0] > self.ttl:
+                return None
+            return json.loads(zlib.decompress(row[1]))
+        except (sqlite3.Error, OSError, ValueError, zlib.error):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value under a key."""
+        if self.ttl <= 0:
+            return
+
+        data = zlib.compress(json.dumps(value).encode())
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?)",
+                    (key, time.time(), data),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+        if key.startswith("search:page:"):
+            self._page_searches_dropped = False
+
+    def put_many(self, items: dict[str, Any]) -> None:
+        """Store several values in a single transaction."""
+        if self.ttl <= 0 or not items:
+            return
+
+        now = time.time()
+        rows = [
+            (key, now, zlib.compress(json.dumps(value).encode())) for key, value in items.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO metadata VALUES (?, ?, ?)", rows)
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop every entry whose key starts with one of the given prefixes."""
+        try:
+            with self._connect() as conn:
+                for prefix in prefixes:
+                    conn.execute(
+                        "DELETE FROM metadata WHERE substr(key, 1, ?) = ?",
+                        (len(prefix), prefix),
+                    )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate_for_write(
+        self,
+        path: str,
+        body: dict[str, Any] | None = None,
+        response: Any = None,
+    ) -> None:
+        """Drop the entries a successful write request to ``path`` may have made stale.
+
+        Args:
+            path: API path the write was sent to
+            body: Body of the write request
+            response: Object the API returned for the write
+        """
+        if path.startswith(("databases", "data_sources")):
+            # Schema changes show up in database objects and data source searches
+            self.invalidate("database:", "data_source:", "search:")
+        elif path.startswith("pages"):
+            # Bulk writes would otherwise delete the page searches once per page
+            if not self._page_searches_dropped:
+                self.invalidate("search:page:")
+                self._page_searches_dropped = True
+            if body and body.get("properties") and isinstance(response, dict):
+                self._invalidate_new_options(body["properties"], response.get("parent") or {})
+
+    def _invalidate_new_options(self, values: dict[str, Any], parent: dict[str, Any]) -> None:
+        """Drop the parent's cached schema if a page write added a select option to it."""
+        keys = []
+        if parent.get("data_source_id"):
+            keys.append(f"data_source:{parent['data_source_id']}")
+        if parent.get("database_id"):
+            keys.append(f"database:{parent['database_id']}")
+
+        for key in keys:
+            cached = self.get(key)
+            if isinstance(cached, dict) and _adds_options(values, cached.get("properties", {})):
+                # Data source listings carry the schema too
+                self.invalidate(*keys, "search:data_source")
+                return
+
+
+class UploadCache(_SQLiteCache):
+    """Cache of completed file uploads, keyed by the SHA-256 of the file contents.
+
+    An upload that was never attached expires on Notion's side; its
+    ``expiry_time`` is stored so expired uploads are skipped without a request.
+    Once attached, an upload has no expiry and can be attached again.
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS uploads ("
+        " sha256 TEXT PRIMARY KEY,"
+        " file_upload_id TEXT NOT NULL,"
+        " expires_at REAL,"
+        " stored_at REAL NOT NULL)"
+    )
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the cache, defaulting to the user cache directory."""
+        super().__init__(path or Path(user_cache_dir("notion", "notion")) / "uploads.db")
+
+    def get(self, sha256: str) -> str | None:
+        """Return the ID of an unexpired upload with the given content hash."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT file_upload_id, expires_at, stored_at FROM uploads WHERE sha256 = ?",
+                    (sha256,),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if not row or row[2] < self.not_before:
+            return None
+        if row[1] is not None and row[1] <= time.time():
+            self.invalidate(sha256)
+            return None
+        return row[0]
+
+    def put(self, sha256: str, file_upload_id: str, expiry_time: str | None = None) -> None:
+        """Remember an upload, with the ``expiry_time`` reported by the API if any."""
+        expires_at = _parse_timestamp(expiry_time) if expiry_time else None
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?)",
+                    (sha256, file_upload_id, expires_at, time.time()),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate(self, sha256: str) -> None:
+        """Forget the upload with the given content hash."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM uploads WHERE sha256 = ?", (sha256,))
+        except (sqlite3.Error, OSError):
+            pass
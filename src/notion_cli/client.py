@@ -1,12 +1,247 @@
 """Notion API client wrapper."""
 
+import hashlib
+import importlib.util
+import json
+import mmap
 import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
+from urllib.parse import unquote
 
+import httpx
 from notion_client import Client
+from notion_client.client import ClientOptions
 from notion_client.errors import APIResponseError
 
-from .config import ConfigManager
+from .cache import BlockCache, MetadataCache, UploadCache, workspace_cache_dir
+from .config import ConfigManager, NotionConfig
+from .filters import FilterCondition, NotionFilterConverter
+from .index import SIMILARITY_THRESHOLD, DatabaseIndex, IndexEntry, TitleIndex, similarity
+from .mirror import DatabaseMirror
+from .scheduler import RequestScheduler, SingleFlight
+
+
+def _is_read_only(method: str, path: str) -> bool:
+    """Check whether a request only reads data."""
+    method = method.upper()
+    if method == "GET":
+        return True
+    return method == "POST" and (path == "search" or path.endswith("/query"))
+
+
+def _is_idempotent(method: str, path: str) -> bool:
+    """Check whether a request can safely be repeated after a server error."""
+    method = method.upper()
+    if method in ("GET", "DELETE"):
+        return True
+    if method == "POST":
+        # Search and data source queries are read-only despite using POST, and
+        # re-sending the contents of a pending file upload replaces the first attempt
+        return path == "search" or path.endswith(("/query", "/send"))
+    if method == "PATCH":
+        # Appending children twice would duplicate content
+        return not path.endswith("/children")
+    return False
+
+
+def http_client_options(config: NotionConfig) -> dict[str, Any]:
+    """Build keyword arguments for the pooled httpx client shared by all requests.
+
+    HTTP/2 is only enabled when requested and the optional ``h2`` package is
+    installed; otherwise connections fall back to HTTP/1.1 keep-alive.
+    """
+    http2 = config.http2 and importlib.util.find_spec("h2") is not None
+    return {
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=max(config.max_concurrency, 1) * 2,
+            max_keepalive_connections=max(config.max_concurrency, 1),
+            keepalive_expiry=60.0,
+        ),
+    }
+
+
+def rewind_form_data(form_data: dict[Any, Any] | None) -> None:
+    """Seek file objects in multipart form data back to the start before a (re)send."""
+    for value in (form_data or {}).values():
+        file_obj = value[1] if isinstance(value, tuple) and len(value) >= 2 else value
+        if hasattr(file_obj, "seek"):
+            file_obj.seek(0)
+
+
+# Files up to this size are sent in one request; larger ones use multi-part mode
+SINGLE_PART_LIMIT = 20 * 1024 * 1024
+
+# Size of each part of a multi-part upload; Notion accepts 5-20 MB (the last part may be smaller)
+UPLOAD_PART_SIZE = 10 * 1024 * 1024
+
+# Fuzzy lookup hits that Notion didn't return as candidates and are retrieved again
+MAX_UNCONFIRMED_TITLES = 10
+
+
+def upload_part_ranges(file_size: int) -> list[tuple[int, int]]:
+    """Split a file into ``(offset, length)`` ranges for a multi-part upload."""
+    return [
+        (offset, min(UPLOAD_PART_SIZE, file_size - offset))
+        for offset in range(0, file_size, UPLOAD_PART_SIZE)
+    ]
+
+
+def file_sha256(file_path: str) -> str:
+    """Return the hex SHA-256 digest of a file's contents, read in chunks."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class FileSlice:
+    """Read-only file object over a byte range of a memory-mapped file.
+
+    Each read copies only the requested chunk, so sending a part streams it
+    from the page cache instead of loading the part into memory.
+    """
+
+    def __init__(self, data: mmap.mmap, offset: int, length: int) -> None:
+        """Initialize the slice over ``data[offset:offset + length]``."""
+        self._data = data
+        self._offset = offset
+        self._length = length
+        self._position = 0
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read up to ``size`` bytes (all remaining bytes if negative or None)."""
+        end = self._length if size is None or size < 0 else self._position + size
+        end = max(min(end, self._length), self._position)
+        chunk = self._data[self._offset + self._position : self._offset + end]
+        self._position = end
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Move the read position, like ``io.IOBase.seek``."""
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._length}[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        """Return the read position."""
+        return self._position
+
+
+def _prefetch_pages(
+    fetch: Callable[[str | None], dict[str, Any] | None],
+    start_cursor: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield successive pages of a paginated endpoint, double-buffered.
+
+    As soon as a page's ``next_cursor`` is known, the following page is requested
+    on a worker thread, so it downloads while the caller processes the current one.
+    ``fetch`` receives the cursor (``start_cursor`` for the first page) and may
+    return None to stop paginating.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-prefetch")
+    try:
+        response = fetch(start_cursor)
+        while response is not None:
+            pending: Future[dict[str, Any] | None] | None = None
+            next_cursor = response.get("next_cursor")
+            if response.get("has_more", False) and next_cursor:
+                pending = executor.submit(fetch, next_cursor)
+
+            yield response
+
+            if pending is None:
+                break
+            response = pending.result()
+    finally:
+        # Don't block an early exit on a page nobody will read
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ScheduledClient(Client):
+    """Notion client that sends every request through a RequestScheduler.
+
+    Identical read requests in flight at the same time are sent only once.
+    Successful writes invalidate the affected entries of ``metadata_cache``.
+    """
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        metadata_cache: MetadataCache | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the client with the scheduler shared by all its requests."""
+        self.scheduler = scheduler
+        self.metadata_cache = metadata_cache
+        self.single_flight = SingleFlight()
+        if "retry" in ClientOptions.__dataclass_fields__:
+            # Newer notion-client versions retry on their own, bypassing the rate limit
+            kwargs.setdefault("retry", False)
+        super().__init__(**kwargs)
+
+    def request(
+        self,
+        path: str,
+        method: str,
+        query: dict[Any, Any] | None = None,
+        body: dict[Any, Any] | None = None,
+        form_data: dict[Any, Any] | None = None,
+        auth: str | None = None,
+    ) -> Any:
+        """Send an HTTP request under the rate limit, retrying transient failures."""
+        if _is_read_only(method, path):
+            key = (
+                method,
+                path,
+                json.dumps(query, sort_keys=True, default=str),
+                json.dumps(body, sort_keys=True, default=str),
+                auth,
+            )
+            return self.single_flight.call(
+                key, self._schedule, path, method, query, body, form_data, auth
+            )
+
+        response = self._schedule(path, method, query, body, form_data, auth)
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate_for_write(path, body, response)
+        return response
+
+    def _schedule(
+        self,
+        path: str,
+        method: str,
+        query: dict[Any, Any] | None,
+        body: dict[Any, Any] | None,
+        form_data: dict[Any, Any] | None,
+        auth: str | None,
+    ) -> Any:
+        """Send a request through the scheduler."""
+        return self.scheduler.call(
+            self._send,
+            path,
+            method,
+            query,
+            body,
+            form_data,
+            auth,
+            retry_server_errors=_is_idempotent(method, path),
+        )
+
+    def _send(
+        self,
+        path: str,
+        method: str,
+        query: dict[Any, Any] | None,
+        body: dict[Any, Any] | None,
+        form_data: dict[Any, Any] | None,
+        auth: str | None,
+    ) -> Any:
+        """Send a single attempt of a request."""
+        # Retried uploads must send the file from the start again
+        rewind_form_data(form_data)
+        return super().request(path, method, query, body, form_data, auth)
 
 
 class NotionClientWrapper:
@@ -23,9 +258,35 @@ class NotionClientWrapper:
                 "Run 'notion auth setup --token <your-token>' first.",
             )
 
-        self.client = Client(auth=config.integration_token)
+        self.scheduler = RequestScheduler.from_config(config)
+        # Cached objects belong to the token's workspace, so each token keeps its own
+        cache_dir = workspace_cache_dir(config.integration_token)
+        self.metadata_cache = MetadataCache(
+            cache_dir / "metadata.db", ttl=config.metadata_cache_ttl
+        )
+        self.block_cache = BlockCache(
+            cache_dir / "blocks.db", max_bytes=config.block_cache_mb * 1024 * 1024
+        )
+        self.database_index = DatabaseIndex(
+            cache_dir / "database_index.json", aliases=config.databases
+        )
+        self.title_index = TitleIndex(cache_dir / "titles.db")
+        self.mirror = DatabaseMirror(cache_dir / "mirror.db")
+        self.upload_cache = UploadCache(cache_dir / "uploads.db")
+        # One pooled keep-alive transport carries every API call, uploads included
+        self.http_client = httpx.Client(**http_client_options(config))
+        self.client = ScheduledClient(
+            self.scheduler,
+            metadata_cache=self.metadata_cache,
+            auth=config.integration_token,
+            client=self.http_client,
+        )
         self.config = config
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.http_client.close()
+
     def test_connection(self) -> bool:
         """Test if the connection to Notion is working."""
         try:
@@ -34,46 +295,158 @@ class NotionClientWrapper:
         except APIResponseError:
             return False
 
+    def _iter_search(self, prefetch: bool = True, **search_params: Any) -> Iterator[dict[str, Any]]:
+        """Yield search results across all pages.
+
+        Args:
+            prefetch: Fetch the next page ahead. Disable it for scans that usually
+                stop within the first page.
+            **search_params: Parameters for the search endpoint
+        """
+
+        def fetch_page(start_cursor: str | None) -> dict[str, Any]:
+            return self.client.search(
+                **search_params,
+                start_cursor=start_cursor,
+                page_size=100,
+            )
+
+        if prefetch:
+            for response in _prefetch_pages(fetch_page):
+                yield from response.get("results", [])
+            return
+
+        start_cursor = None
+        while True:
+            response = fetch_page(start_cursor)
+            yield from response.get("results", [])
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more", False) or not start_cursor:
+                break
+
+    def iter_databases(self) -> Iterator[dict[str, Any]]:
+        """Yield all accessible databases, following pagination.
+
+        Stopping early skips the remaining pages. A complete listing is cached and
+        replaces the local name index; a partial one only adds to the index.
+        """
+        cached = self.metadata_cache.get("search:data_source")
+        if cached is not None:
+            yield from cached
+            return
+
+        databases: list[dict[str, Any]] = []
+        complete = False
+        try:
+            for db in self._iter_search(filter={"property": "object", "value": "data_source"}):
+                databases.append(db)
+                yield db
+            complete = True
+        except APIResponseError as e:
+            raise Exception(f"Failed to list databases: {e}")
+        finally:
+            self._remember_databases(databases, complete)
+
+    def _remember_databases(self, databases: list[dict[str, Any]], complete: bool) -> None:
+        """Feed listed databases to the metadata cache and the name index."""
+        # Search results are full data source objects; reuse them for index hits
+        self.metadata_cache.put_many({f"data_source:{db.get('id')}": db for db in databases})
+
+        titles = [(self._extract_database_title(db), db.get("id", "")) for db in databases]
+        if complete:
+            self.metadata_cache.put("search:data_source", databases)
+            self.database_index.rebuild(titles)
+        else:
+            self.database_index.add(titles)
+
     def list_databases(self) -> list[dict[str, Any]]:
         """List all accessible databases."""
+        return list(self.iter_databases())
+
+    def _extract_database_title(self, database: dict[str, Any]) -> str:
+        """Extract the plain text title of a database or data source."""
+        title = database.get("title")
+        if isinstance(title, list) and title:
+            return title[0].get("plain_text", "")
+        if isinstance(title, str):
+            return title
+        return ""
+
+    def _retrieve_data_source(self, data_source_id: str) -> dict[str, Any]:
+        """Fetch a data source through the metadata cache, letting API errors through."""
+        cached = self.metadata_cache.get(f"data_source:{data_source_id}")
+        if cached is not None:
+            return cached
+
+        data_source = self.client.data_sources.retrieve(data_source_id=data_source_id)
+        self.metadata_cache.put(f"data_source:{data_source_id}", data_source)
+        return data_source
+
+    def get_data_source_by_id(self, data_source_id: str) -> dict[str, Any]:
+        """Get a data source (a database's schema and entries) by its ID."""
         try:
-            response = self.client.search(
-                filter={"property": "object", "value": "data_source"},
-            )
-            return response.get("results", [])
+            return self._retrieve_data_source(data_source_id)
         except APIResponseError as e:
-            raise Exception(f"Failed to list databases: {e}")
+            raise Exception(f"Failed to retrieve data source {data_source_id}: {e}")
+
+    def _resolve_index_entry(self, entry: IndexEntry) -> dict[str, Any] | None:
+        """Fetch the database behind an index entry, or None if the entry is stale.
+
+        Only a 404 marks the entry stale; rate limits, network and permission
+        errors are re-raised so a transient failure never evicts a good entry.
+        """
+        try:
+            database = self._retrieve_data_source(entry.database_id)
+        except APIResponseError as e:
+            if e.status != 404:
+                raise Exception(f"Failed to retrieve data source {entry.database_id}: {e}")
+            if not entry.alias:
+                self.database_index.remove(entry.database_id)
+            return None
+
+        # Titles may have been renamed since they were indexed; aliases are trusted
+        if not entry.alias and self._extract_database_title(database) != entry.name:
+            return None
+        return database
 
     def get_database_by_name(self, name: str) -> dict[str, Any] | None:
-        """Get a database by its title."""
+        """Get a database by its title or configured alias.
+
+        Names are resolved through the local index first and only fall back to
+        a workspace search (which refreshes the index) on a miss.
+        """
+        for entry in self.database_index.find(name):
+            database = self._resolve_index_entry(entry)
+            if database:
+                return database
+
         databases = self.list_databases()
 
         for db in databases:
-            db_title = ""
-            if "title" in db and db["title"]:
-                if isinstance(db["title"], list) and db["title"]:
-                    db_title = db["title"][0].get("plain_text", "")
-                elif isinstance(db["title"], str):
-                    db_title = db["title"]
-
+            db_title = self._extract_database_title(db)
             if db_title.lower() == name.lower():
                 return db
 
         return None
 
     def find_databases_by_prefix(self, prefix: str) -> list[tuple[str, dict[str, Any]]]:
-        """Find databases that start with the given prefix."""
+        """Find databases whose title or alias starts with the given prefix."""
+        entries = self.database_index.find_prefix(prefix)
+        matches = []
+        for entry in entries:
+            database = self._resolve_index_entry(entry)
+            if database is None:
+                break
+            matches.append((entry.name, database))
+        if entries and len(matches) == len(entries):
+            return matches
+
+        # The index missed or is stale: fall back to a workspace search
         databases = self.list_databases()
         matches = []
 
         for db in databases:
-            db_title = ""
-            if "title" in db and db["title"]:
-                if isinstance(db["title"], list) and db["title"]:
-                    db_title = db["title"][0].get("plain_text", "")
-                elif isinstance(db["title"], str):
-                    db_title = db["title"]
-
+            db_title = self._extract_database_title(db)
             if db_title.lower().startswith(prefix.lower()):
                 matches.append((db_title, db))
 
@@ -138,13 +511,6 @@ class NotionClientWrapper:
                     console.print("❌ Operation cancelled", style="yellow")
                     raise typer.Exit(1)
 
-    def get_database_by_id(self, database_id: str) -> dict[str, Any]:
-        """Get a database by its ID."""
-        try:
-            return self.client.databases.retrieve(database_id=database_id)
-        except APIResponseError as e:
-            raise Exception(f"Failed to get database {database_id}: {e}")
-
     def query_database(
         self,
         database_id: str,
@@ -152,11 +518,15 @@ class NotionClientWrapper:
         sorts: list[dict[str, Any]] | None = None,
         start_cursor: str | None = None,
         page_size: int | None = None,
+        filter_properties: list[str] | None = None,
     ) -> dict[str, Any]:
         """Query a database with optional filters and sorting.
 
         Note: In API version 2025-09-03+, this uses data_sources.query.
         For single-source databases, database_id == data_source_id.
+
+        Args:
+            filter_properties: IDs of the only properties to return for each entry
         """
         try:
             query_params = {}
@@ -168,12 +538,15 @@ class NotionClientWrapper:
                 query_params["start_cursor"] = start_cursor
             if page_size:
                 query_params["page_size"] = page_size
+            if filter_properties:
+                # Property IDs come URL-encoded from the API; httpx encodes them again
+                query_params["filter_properties"] = [unquote(p) for p in filter_properties]
 
             # API version 2025-09-03+ uses data_sources.query
             # For single-source databases, database_id works as data_source_id
             return self.client.data_sources.query(data_source_id=database_id, **query_params)
         except APIResponseError as e:
-            raise Exception(f"Failed to query database {database_id}: {e}")
+            raise Exception(f"Failed to query database {database_id}: {e}") from e
 
     def create_page(
         self,
@@ -304,8 +677,14 @@ class NotionClientWrapper:
         Returns:
             Database object
         """
+        cached = self.metadata_cache.get(f"database:{database_id}")
+        if cached is not None:
+            return cached
+
         try:
-            return self.client.databases.retrieve(database_id=database_id)
+            database = self.client.databases.retrieve(database_id=database_id)
+            self.metadata_cache.put(f"database:{database_id}", database)
+            return database
         except APIResponseError as e:
             raise Exception(f"Failed to retrieve database {database_id}: {e}")
 
@@ -340,8 +719,9 @@ class NotionClientWrapper:
 
             # Replace content blocks if provided
             if children:
-                # Delete all existing blocks
-                existing_blocks = self.get_page_blocks(page_id)
+                # Delete all existing blocks; nested blocks go away with their parent
+                existing_blocks = self._list_block_children(page_id)
+                self.block_cache.invalidate(page_id)
                 for block in existing_blocks:
                     block_id = block.get("id")
                     if block_id:
@@ -363,55 +743,77 @@ class NotionClientWrapper:
     def delete_page(self, page_id: str) -> dict[str, Any]:
         """Delete a page (archive it)."""
         try:
-            return self.client.pages.update(page_id=page_id, archived=True)
+            page = self.client.pages.update(page_id=page_id, archived=True)
+            self.title_index.remove(page_id)
+            return page
         except APIResponseError as e:
             raise Exception(f"Failed to delete page {page_id}: {e}")
 
-    def get_database_entries(
+    def iter_database_entries(
         self,
         database_id: str,
         limit: int | None = None,
         filter_conditions: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
-        """Get entries from a database with pagination support."""
-        try:
-            all_entries = []
-            start_cursor = None
+        sorts: list[dict[str, Any]] | None = None,
+        filter_properties: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield entries from a database as each page of query results arrives.
+
+        The next page is prefetched in the background while the caller processes
+        the current one. No further pages are requested once ``limit`` entries have
+        been yielded or the caller stops iterating, so partial reads stay cheap.
+        Pass ``filter_properties`` (property IDs) to only download those properties.
+        """
+        for response in self.iter_database_pages(
+            database_id, limit, filter_conditions, sorts, filter_properties
+        ):
+            yield from response.get("results", [])
 
-            while True:
-                # If limit is None, get all entries (max 100 per page)
-                # If limit is set, calculate remaining entries needed
-                if limit is None:
-                    page_size = 100  # Notion API max per page
-                else:
-                    remaining = limit - len(all_entries)
-                    if remaining <= 0:
-                        break
-                    page_size = min(100, remaining)
-
-                response = self.query_database(
-                    database_id=database_id,
-                    filter_conditions=filter_conditions,
-                    start_cursor=start_cursor,
-                    page_size=page_size,
-                )
+    def iter_database_pages(
+        self,
+        database_id: str,
+        limit: int | None = None,
+        filter_conditions: dict[str, Any] | None = None,
+        sorts: list[dict[str, Any]] | None = None,
+        filter_properties: list[str] | None = None,
+        start_cursor: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the raw responses of a database query as they arrive.
 
-                entries = response.get("results", [])
-                all_entries.extend(entries)
+        Prefetching and ``limit`` work as in ``iter_database_entries``. Each
+        response's ``next_cursor`` can be passed back as ``start_cursor`` to
+        resume the query after it.
+        """
+        requested = 0
 
-                # Check if there are more pages
-                if not response.get("has_more", False):
-                    break
+        def fetch_page(start_cursor: str | None) -> dict[str, Any] | None:
+            nonlocal requested
+            # Notion returns at most 100 entries per page
+            page_size = 100 if limit is None else min(100, limit - requested)
+            if page_size <= 0:
+                return None
+            requested += page_size
+
+            return self.query_database(
+                database_id=database_id,
+                filter_conditions=filter_conditions,
+                sorts=sorts,
+                start_cursor=start_cursor,
+                page_size=page_size,
+                filter_properties=filter_properties,
+            )
 
-                start_cursor = response.get("next_cursor")
-                if not start_cursor:
-                    break
+        yield from _prefetch_pages(fetch_page, start_cursor)
 
-            # Apply limit if specified
-            if limit is not None:
-                return all_entries[:limit]
-            else:
-                return all_entries
+    def get_database_entries(
+        self,
+        database_id: str,
+        limit: int | None = None,
+        filter_conditions: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get entries from a database with pagination support."""
+        try:
+            return list(self.iter_database_entries(database_id, limit, filter_conditions))
         except Exception as e:
             raise Exception(f"Failed to get entries from database {database_id}: {e}")
 
@@ -636,11 +1038,12 @@ class NotionClientWrapper:
         return columns, widths
 
     def upload_file(self, file_path: str) -> dict[str, Any]:
-        """Upload a file to Notion and return the file object."""
-        import mimetypes
-        import os
+        """Upload a file to Notion and return the file object.
 
-        import requests
+        Files over 20MB are sent in multi-part mode, several parts at a time. A file
+        whose contents were uploaded before reuses that upload when it is still valid.
+        """
+        import mimetypes
 
         if not os.path.exists(file_path):
             raise ValueError(f"File not found: {file_path}")
@@ -648,45 +1051,39 @@ class NotionClientWrapper:
         file_name = os.path.basename(file_path)
         file_size = os.path.getsize(file_path)
 
-        # Check file size limit (20MB for single-part upload)
-        max_size = 20 * 1024 * 1024  # 20MB in bytes
-        if file_size > max_size:
-            raise ValueError(
-                f"File size ({file_size} bytes) exceeds 20MB limit for single-part upload",
-            )
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if not mime_type:
+            mime_type = "application/octet-stream"
 
         try:
-            # Step 1: Create file upload object
-            create_response = requests.post(
-                "https://api.notion.com/v1/file_uploads",
-                json={"filename": file_name},
-                headers={
-                    "Authorization": f"Bearer {self.config.integration_token}",
-                    "Content-Type": "application/json",
-                    "Notion-Version": "2022-06-28",
-                },
-            )
-            create_response.raise_for_status()
-            upload_data = create_response.json()
-
-            file_upload_id = upload_data["id"]
+            digest = file_sha256(file_path)
+            file_upload_id = self._reusable_upload(digest)
+            if file_upload_id:
+                return {
+                    "name": file_name,
+                    "type": "file_upload",
+                    "file_upload": {"id": file_upload_id},
+                }
 
-            # Step 2: Upload file contents
-            with open(file_path, "rb") as f:
-                mime_type, _ = mimetypes.guess_type(file_path)
-                if not mime_type:
-                    mime_type = "application/octet-stream"
-
-                files = {"file": (file_name, f, mime_type)}
-                upload_response = requests.post(
-                    f"https://api.notion.com/v1/file_uploads/{file_upload_id}/send",
-                    headers={
-                        "Authorization": f"Bearer {self.config.integration_token}",
-                        "Notion-Version": "2022-06-28",
-                    },
-                    files=files,
+            if file_size > SINGLE_PART_LIMIT:
+                upload_data = self._upload_multi_part(file_path, file_name, mime_type)
+            else:
+                # Step 1: Create file upload object
+                upload_data = self.client.file_uploads.create(
+                    filename=file_name,
+                    content_type=mime_type,
                 )
-                upload_response.raise_for_status()
+                file_upload_id = upload_data["id"]
+
+                # Step 2: Upload file contents
+                with open(file_path, "rb") as f:
+                    upload_data = self.client.file_uploads.send(
+                        file_upload_id=file_upload_id,
+                        file=(file_name, f, mime_type),
+                    )
+
+            file_upload_id = upload_data["id"]
+            self.upload_cache.put(digest, file_upload_id, upload_data.get("expiry_time"))
 
             # Return file object for use in properties
             # Use file_upload type with the upload ID
@@ -696,34 +1093,120 @@ class NotionClientWrapper:
                 "file_upload": {"id": file_upload_id},
             }
 
-        except requests.exceptions.RequestException as e:
-            if hasattr(e.response, "json"):
-                error_details = e.response.json()
-                raise ValueError(f"File upload failed: {error_details}")
-            else:
-                raise ValueError(f"File upload failed: {e}")
+        except APIResponseError as e:
+            raise ValueError(f"File upload failed: {e}")
         except Exception as e:
             raise ValueError(f"Unexpected error during file upload: {e}")
 
+    def _reusable_upload(self, digest: str) -> str | None:
+        """Return the ID of a cached upload of the same contents if Notion still has it."""
+        file_upload_id = self.upload_cache.get(digest)
+        if not file_upload_id:
+            return None
+
+        try:
+            upload_data = self.client.file_uploads.retrieve(file_upload_id=file_upload_id)
+        except APIResponseError:
+            upload_data = {}
+
+        if upload_data.get("status") != "uploaded":
+            self.upload_cache.invalidate(digest)
+            return None
+
+        self.upload_cache.put(digest, file_upload_id, upload_data.get("expiry_time"))
+        return file_upload_id
+
+    def _upload_multi_part(self, file_path: str, file_name: str, mime_type: str) -> dict[str, Any]:
+        """Send a large file in parts and return the completed file upload object.
+
+        Parts are read from a memory map and sent concurrently. Each part is retried
+        on its own by the scheduler, so a failed part does not restart the upload.
+        """
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            parts = upload_part_ranges(len(data))
+            upload_data = self.client.file_uploads.create(
+                mode="multi_part",
+                filename=file_name,
+                content_type=mime_type,
+                number_of_parts=len(parts),
+            )
+            file_upload_id = upload_data["id"]
+
+            def send_part(part_number: int, offset: int, length: int) -> None:
+                self.client.file_uploads.send(
+                    file_upload_id=file_upload_id,
+                    file=(file_name, FileSlice(data, offset, length), mime_type),
+                    part_number=str(part_number),
+                )
+
+            with ThreadPoolExecutor(max_workers=max(self.config.max_concurrency, 1)) as executor:
+                futures = [
+                    executor.submit(send_part, part_number, offset, length)
+                    for part_number, (offset, length) in enumerate(parts, start=1)
+                ]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Don't start the remaining parts of an upload that can't complete
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return self.client.file_uploads.complete(file_upload_id=file_upload_id)
+
+    def upload_files(
+        self,
+        files: list[str],
+        on_progress: Callable[[str, Exception | None], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Upload files concurrently, skipping the ones that fail.
+
+        Args:
+            files: Paths of the files to upload
+            on_progress: Called in the calling thread as each upload finishes, with
+                the file path and the error if the upload failed
+
+        Returns:
+            The uploaded file objects, in the order of ``files``
+        """
+        if not files:
+            return []
+
+        uploaded: list[dict[str, Any] | None] = [None] * len(files)
+        workers = min(len(files), max(self.config.max_concurrency, 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.upload_file, file_path): index
+                for index, file_path in enumerate(files)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                error = None
+                try:
+                    uploaded[index] = future.result()
+                except Exception as e:
+                    error = e
+                if on_progress:
+                    on_progress(files[index], error)
+
+        return [file_obj for file_obj in uploaded if file_obj is not None]
+
     def prepare_file_properties(
         self,
         files: list[str],
         file_properties: list[str],
+        on_progress: Callable[[str, Exception | None], None] | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Prepare file objects for Notion properties."""
-        if not files:
-            return {}
+        """Upload files concurrently and map them to file properties.
 
-        file_objects = []
-        for file_path in files:
-            try:
-                file_obj = self.upload_file(file_path)
-                file_objects.append(file_obj)
-                print(f"✅ Uploaded: {os.path.basename(file_path)}")
-            except Exception as e:
-                print(f"❌ Failed to upload {os.path.basename(file_path)}: {e}")
-                continue
+        Files that fail to upload are skipped; see ``upload_files``.
 
+        Returns:
+            Dictionary mapping each property name to the uploaded file objects,
+            in the order of ``files``
+        """
+        file_objects = self.upload_files(files, on_progress)
         if not file_objects:
             return {}
 
@@ -734,57 +1217,214 @@ class NotionClientWrapper:
 
         return result
 
-    def search_pages(self, query: str = "") -> list[dict[str, Any]]:
-        """Search for pages in the workspace."""
+    def iter_pages(self, query: str = "") -> Iterator[dict[str, Any]]:
+        """Yield pages matching a search query, following pagination.
+
+        Stopping early skips the remaining pages; only complete results are cached.
+        """
+        cache_key = f"search:page:{query}"
+        cached = self.metadata_cache.get(cache_key)
+        if cached is not None:
+            yield from cached
+            return
+
         try:
-            search_params = {"filter": {"property": "object", "value": "page"}}
+            search_params: dict[str, Any] = {"filter": {"property": "object", "value": "page"}}
 
             if query:
                 search_params["query"] = query
 
-            response = self.client.search(**search_params)
-            return response.get("results", [])
+            pages = []
+            for page in self._iter_search(**search_params):
+                pages.append(page)
+                yield page
+            self.metadata_cache.put(cache_key, pages)
         except APIResponseError as e:
             raise Exception(f"Failed to search pages: {e}")
 
+    def search_pages(self, query: str = "") -> list[dict[str, Any]]:
+        """Search for pages in the workspace."""
+        return list(self.iter_pages(query))
+
     def get_page_by_name(self, name: str, fuzzy: bool = True) -> list[dict[str, Any]]:
-        """Get pages by name with optional fuzzy matching."""
-        all_pages = self.search_pages()
+        """Get pages by name with optional fuzzy matching.
 
-        if not all_pages:
-            return []
+        Both kinds of lookup send the name as the search query so Notion only
+        returns candidate pages. Fuzzy lookups add the candidates to the local
+        title index and rank them together with similar titles found by earlier
+        lookups, so a misspelled name still finds a page seen before.
+        """
+        if fuzzy:
+            candidates = [(self._extract_page_title(page), page) for page in self.iter_pages(name)]
+            self.title_index.update("pages", candidates)
+            fresh = {page.get("id", "") for _, page in candidates}
+            return self._rank_titles(self._search_title_index("pages", name, fresh), name)
 
         matching_pages = []
         name_lower = name.lower()
 
-        for page in all_pages:
+        for page in self.iter_pages(name):
             page_title = self._extract_page_title(page)
-            page_title_lower = page_title.lower()
-
-            if fuzzy:
-                # Fuzzy matching - check if query is contained in title
-                if name_lower in page_title_lower:
-                    matching_pages.append(
-                        {
-                            **page,
-                            "_title": page_title,
-                            "_match_score": self._calculate_match_score(
-                                name_lower,
-                                page_title_lower,
-                            ),
-                        },
-                    )
-            else:
-                # Exact matching
-                if page_title_lower == name_lower:
-                    matching_pages.append(
-                        {**page, "_title": page_title, "_match_score": 1.0},
-                    )
+            if page_title.lower() == name_lower:
+                matching_pages.append(
+                    {**page, "_title": page_title, "_match_score": 1.0},
+                )
 
-        # Sort by match score (higher is better)
-        matching_pages.sort(key=lambda x: x["_match_score"], reverse=True)
         return matching_pages
 
+    def _search_title_index(
+        self,
+        scope: str,
+        name: str,
+        fresh: set[str],
+    ) -> list[tuple[float, str, dict[str, Any]]]:
+        """Search the title index, checking hits Notion didn't just return against the API.
+
+        Searches and queries never return objects that were trashed, archived or
+        unshared, so an index hit missing from the ``fresh`` candidates may be
+        gone. The best ``MAX_UNCONFIRMED_TITLES`` of those are retrieved again:
+        vanished objects are dropped from the index and renamed ones re-scored.
+        The rest are left out.
+        """
+        results = self.title_index.search(scope, name)
+        confirmed = [result for result in results if result[2].get("id") in fresh]
+        unconfirmed = [result for result in results if result[2].get("id") not in fresh]
+        unconfirmed = unconfirmed[:MAX_UNCONFIRMED_TITLES]
+        if not unconfirmed:
+            return confirmed
+
+        def retrieve(object_id: str) -> dict[str, Any] | None:
+            try:
+                return self.client.pages.retrieve(page_id=object_id)
+            except APIResponseError:
+                return None
+
+        workers = min(len(unconfirmed), max(self.config.max_concurrency, 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            objects = list(executor.map(retrieve, [obj.get("id", "") for _, _, obj in unconfirmed]))
+
+        for (score, title, obj), current in zip(unconfirmed, objects, strict=True):
+            if current is None or current.get("archived") or current.get("in_trash"):
+                self.title_index.remove(obj.get("id", ""))
+                continue
+
+            current_title = self._extract_page_title(current)
+            if current_title != title:
+                self.title_index.update(scope, [(current_title, current)])
+                score = similarity(name, current_title)
+                if score < SIMILARITY_THRESHOLD and name.lower() not in current_title.lower():
+                    continue
+            confirmed.append((score, current_title, current))
+        return confirmed
+
+    def sync_mirror(
+        self,
+        database: dict[str, Any],
+        full: bool = False,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Bring the local mirror of a database up to date.
+
+        The first sync scans every entry; later ones only fetch the entries edited
+        since the mirror's high-water mark. Entries are fetched oldest edit first
+        and stored a page at a time, so an interrupted sync resumes where it
+        stopped. Entries deleted in Notion never show up in a query, so only a
+        full sync drops them from the mirror.
+
+        Args:
+            database: Database object to mirror
+            full: Rescan every entry even if the database was synced before
+            on_progress: Called with the number of entries fetched after each page
+
+        Returns:
+            Number of entries fetched
+        """
+        database_id = database.get("id", "")
+        high_water_mark = None
+        if not full and not self.mirror.refresh:
+            high_water_mark = self.mirror.high_water_mark(database_id)
+
+        filter_conditions = None
+        if high_water_mark:
+            # Timestamps are truncated to the minute, so that minute is fetched again
+            filter_conditions = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": high_water_mark},
+            }
+
+        self.mirror.begin(database, self._extract_database_title(database))
+        started = time.time()
+        fetched = 0
+        # A full sync also replaces the database's titles in the title index
+        replace_titles = high_water_mark is None
+        for response in self.iter_database_pages(
+            database_id,
+            filter_conditions=filter_conditions,
+            sorts=[{"timestamp": "last_edited_time", "direction": "ascending"}],
+        ):
+            entries = response.get("results", [])
+            items = [
+                (self._extract_entry_title(entry.get("properties", {})), entry) for entry in entries
+            ]
+            self.mirror.store(database_id, items)
+            self.title_index.update(f"db:{database_id}", items, full=replace_titles)
+            replace_titles = False
+            fetched += len(entries)
+            if on_progress:
+                on_progress(fetched)
+
+        self.mirror.finish(database_id, full_since=None if high_water_mark else started)
+        return fetched
+
+    def get_mirrored_database(self, name: str) -> dict[str, Any] | None:
+        """Get a synced database by alias, title or title prefix from the local mirror.
+
+        Makes no API calls. Returns None if no synced database matches or the
+        name is ambiguous.
+        """
+        for entry in self.database_index.find(name):
+            database = self.mirror.database(entry.database_id)
+            if database:
+                return database
+
+        matches = self.mirror.find_databases(name)
+        return matches[0][1] if len(matches) == 1 else None
+
+    def get_mirrored_entry_by_name(
+        self,
+        database_id: str,
+        entry_name: str,
+        fuzzy: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Like ``get_database_entry_by_name``, but matched against the local mirror."""
+        results = self.mirror.search(database_id, entry_name)
+        if fuzzy:
+            return self._rank_titles(results, entry_name)
+
+        entry_name_lower = entry_name.lower()
+        return [
+            {**entry, "_title": title, "_match_score": 1.0}
+            for _, title, entry in results
+            if title.lower() == entry_name_lower
+        ]
+
+    def _rank_titles(
+        self, results: list[tuple[float, str, dict[str, Any]]], name: str
+    ) -> list[dict[str, Any]]:
+        """Rank ``(similarity, title, object)`` search results by how well titles match a name."""
+        matches = []
+        name_lower = name.lower()
+
+        for title_similarity, title, obj in results:
+            title_lower = title.lower()
+            # Verbatim matches keep their substring score; typos rely on trigram similarity
+            score = max(title_similarity, self._calculate_match_score(name_lower, title_lower))
+            matches.append({**obj, "_title": title, "_match_score": score})
+
+        # Sort by match score (higher is better)
+        matches.sort(key=lambda x: x["_match_score"], reverse=True)
+        return matches
+
     def _extract_page_title(self, page: dict[str, Any]) -> str:
         """Extract title from a page object."""
         properties = page.get("properties", {})
@@ -839,54 +1479,76 @@ class NotionClientWrapper:
         entry_name: str,
         fuzzy: bool = True,
     ) -> list[dict[str, Any]]:
-        """Get database entries by searching for a specific name/title."""
+        """Get database entries by searching for a specific name/title.
+
+        Both kinds of lookup filter on the title on the server. Fuzzy lookups add
+        the candidates to the local title index and rank them together with
+        similar titles from earlier lookups and ``db sync``.
+        """
         database = self.get_database_by_name(database_name)
         if not database:
             raise ValueError(f"Database '{database_name}' not found")
 
         database_id = database.get("id", "")
-        database.get("properties", {})
-
-        # Get all entries
-        all_entries = self.get_database_entries(database_id)
-
-        if not all_entries:
-            return []
+        if fuzzy:
+            scope = f"db:{database_id}"
+            fresh: set[str] = set()
+            contains_filter = self._title_filter(database, entry_name, "~")
+            if contains_filter:
+                candidates = [
+                    (self._extract_entry_title(entry.get("properties", {})), entry)
+                    for entry in self.iter_database_entries(
+                        database_id, filter_conditions=contains_filter
+                    )
+                ]
+                self.title_index.update(scope, candidates)
+                fresh = {entry.get("id", "") for _, entry in candidates}
+            results = self._search_title_index(scope, entry_name, fresh)
+            return self._rank_titles(results, entry_name)
+
+        title_filter = self._title_filter(database, entry_name, "=")
+
+        entries: Iterator[dict[str, Any]] = self.iter_database_entries(
+            database_id, filter_conditions=title_filter
+        )
+        if title_filter:
+            # Notion's equals is case-sensitive: retry with contains and compare locally
+            exact_entries = list(entries)
+            if exact_entries:
+                entries = iter(exact_entries)
+            else:
+                entries = self.iter_database_entries(
+                    database_id,
+                    filter_conditions=self._title_filter(database, entry_name, "~"),
+                )
 
         matching_entries = []
         entry_name_lower = entry_name.lower()
 
-        for entry in all_entries:
-            entry_properties = entry.get("properties", {})
-
-            # Look for title-like properties
-            entry_title = self._extract_entry_title(entry_properties)
-            entry_title_lower = entry_title.lower()
-
-            if fuzzy:
-                # Fuzzy matching - check if query is contained in title
-                if entry_name_lower in entry_title_lower:
-                    matching_entries.append(
-                        {
-                            **entry,
-                            "_title": entry_title,
-                            "_match_score": self._calculate_match_score(
-                                entry_name_lower,
-                                entry_title_lower,
-                            ),
-                        },
-                    )
-            else:
-                # Exact matching
-                if entry_title_lower == entry_name_lower:
-                    matching_entries.append(
-                        {**entry, "_title": entry_title, "_match_score": 1.0},
-                    )
+        # Stream entries so only the matches are kept in memory
+        for entry in entries:
+            entry_title = self._extract_entry_title(entry.get("properties", {}))
+            if entry_title.lower() == entry_name_lower:
+                matching_entries.append(
+                    {**entry, "_title": entry_title, "_match_score": 1.0},
+                )
 
-        # Sort by match score (higher is better)
-        matching_entries.sort(key=lambda x: x["_match_score"], reverse=True)
         return matching_entries
 
+    def _title_filter(
+        self,
+        database: dict[str, Any],
+        value: str,
+        operator: str,
+    ) -> dict[str, Any] | None:
+        """Build a Notion filter on a database's title property, if it has one."""
+        properties = database.get("properties", {})
+        for prop_name, prop_data in properties.items():
+            if prop_data.get("type") == "title":
+                condition = FilterCondition(prop_name, operator, value)
+                return NotionFilterConverter().convert(condition, properties)
+        return None
+
     def _extract_entry_title(self, entry_properties: dict[str, Any]) -> str:
         """Extract title from database entry properties."""
         # Look for title property first
@@ -937,41 +1599,74 @@ class NotionClientWrapper:
         except APIResponseError as e:
             raise Exception(f"Failed to get page {page_id}: {e}")
 
-    def get_page_blocks(self, page_id: str) -> list[dict[str, Any]]:
-        """Get all blocks from a page with pagination and nested children support."""
+    def _get_last_edited_time(self, page_id: str) -> str | None:
+        """Look up when a page was last edited, or None if it can't be retrieved."""
         try:
-            all_blocks = []
-            start_cursor = None
+            return self.client.pages.retrieve(page_id=page_id).get("last_edited_time")
+        except APIResponseError:
+            return None
 
-            while True:
-                # Fetch blocks from the page
-                if start_cursor:
-                    response = self.client.blocks.children.list(
-                        block_id=page_id,
-                        start_cursor=start_cursor,
-                    )
-                else:
-                    response = self.client.blocks.children.list(block_id=page_id)
+    def _list_block_children(self, block_id: str) -> list[dict[str, Any]]:
+        """List the direct children of a block, following pagination."""
 
-                blocks = response.get("results", [])
-                all_blocks.extend(blocks)
+        def fetch_page(start_cursor: str | None) -> dict[str, Any]:
+            return self.client.blocks.children.list(
+                block_id=block_id,
+                start_cursor=start_cursor,
+                page_size=100,
+            )
 
-                # Check if there are more pages
-                if not response.get("has_more", False):
-                    break
+        blocks: list[dict[str, Any]] = []
+        for response in _prefetch_pages(fetch_page):
+            blocks.extend(response.get("results", []))
+        return blocks
 
-                start_cursor = response.get("next_cursor")
-                if not start_cursor:
-                    break
+    def get_page_blocks(
+        self,
+        page_id: str,
+        last_edited_time: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get all blocks from a page with pagination and nested children support.
 
-            # Recursively fetch children for blocks that have them
-            for block in all_blocks:
-                if block.get("has_children", False):
-                    block_id = block.get("id", "")
-                    if block_id:
-                        children = self.get_page_blocks(block_id)
+        The tree is walked breadth-first: all blocks with children on one level
+        are listed concurrently before moving on to the next level. Trees are
+        cached on disk and reused while the page's last_edited_time is unchanged.
+
+        Args:
+            page_id: ID of the page
+            last_edited_time: The page's current last_edited_time, if already known.
+                Otherwise it is looked up with one extra request.
+        """
+        if last_edited_time is None:
+            last_edited_time = self._get_last_edited_time(page_id)
+        if last_edited_time:
+            cached = self.block_cache.get(page_id, last_edited_time)
+            if cached is not None:
+                return cached
+
+        try:
+            all_blocks = self._list_block_children(page_id)
+            parents = [
+                block for block in all_blocks if block.get("has_children") and block.get("id")
+            ]
+
+            with ThreadPoolExecutor(max_workers=max(self.config.max_concurrency, 1)) as executor:
+                while parents:
+                    levels = executor.map(
+                        self._list_block_children, [block["id"] for block in parents]
+                    )
+                    next_parents = []
+                    for block, children in zip(parents, levels, strict=True):
                         block["children"] = children
+                        next_parents.extend(
+                            child
+                            for child in children
+                            if child.get("has_children") and child.get("id")
+                        )
+                    parents = next_parents
 
+            if last_edited_time:
+                self.block_cache.put(page_id, last_edited_time, all_blocks)
             return all_blocks
         except APIResponseError as e:
             raise Exception(f"Failed to get blocks from page {page_id}: {e}")
@@ -1,7 +1,9 @@
 """Configuration management for Notion CLI."""
 
+import copy
 import os
 from pathlib import Path
+from typing import Any
 
 import toml
 from platformdirs import user_config_dir
@@ -18,10 +20,42 @@ class NotionConfig(BaseModel):
     default_database: str | None = None
     default_view: str | None = None
 
+    # Request scheduling (Notion allows an average of three requests per second)
+    requests_per_second: float = 3.0
+    request_burst: int = 3
+    max_retries: int = 5
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30.0
+    max_concurrency: int = 8
+    http2: bool = False
+
+    # Local caches: page content size cap and metadata lifetime in seconds (0 disables)
+    block_cache_mb: int = 64
+    metadata_cache_ttl: int = 300
+
+
+# Settings only written back when the config file sets them, so that a later
+# change to their default reaches everyone who never chose a value
+_TUNING_FIELDS = (
+    "requests_per_second",
+    "request_burst",
+    "max_retries",
+    "retry_base_delay",
+    "retry_max_delay",
+    "max_concurrency",
+    "http2",
+    "block_cache_mb",
+    "metadata_cache_ttl",
+)
+
 
 class ConfigManager:
     """Manages configuration file operations."""
 
+    # Parsed config files shared by every manager in the process:
+    # path -> ((mtime_ns, size), data)
+    _file_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
     def __init__(self, config_path: Path | None = None) -> None:
         """Initialize config manager with optional custom path."""
         if config_path:
@@ -36,11 +70,8 @@ class ConfigManager:
 
     def load_config(self) -> NotionConfig:
         """Load configuration from file or environment."""
-        config_data = {}
-
         # Load from file if exists
-        if self.config_path.exists():
-            config_data = toml.load(self.config_path)
+        config_data = self._read_config_file()
 
         # Override with environment variables if set
         if env_token := os.getenv("NOTION_TOKEN"):
@@ -65,10 +96,30 @@ class ConfigManager:
 
     def save_config(self, config: NotionConfig) -> None:
         """Save configuration to file."""
-        config_dict = config.model_dump(exclude_none=True)
+        unset = {name for name in _TUNING_FIELDS if name not in config.model_fields_set}
+        config_dict = config.model_dump(exclude_none=True, exclude=unset)
         with open(self.config_path, "w") as f:
             toml.dump(config_dict, f)
 
+        # The rewrite may land within the file system's timestamp resolution
+        self._file_cache.pop(self.config_path, None)
+
+    def _read_config_file(self) -> dict[str, Any]:
+        """Parse the config file, reusing the previous parse while the file is unchanged."""
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            return {}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(self.config_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, toml.load(self.config_path))
+            self._file_cache[self.config_path] = cached
+
+        # Callers add environment overrides to the returned data
+        return copy.deepcopy(cached[1])
+
     def set_token(self, token: str) -> None:
         """Set the integration token."""
         config = self.load_config()
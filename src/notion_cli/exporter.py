@@ -0,0 +1,255 @@
+"""Streaming export of database entries to JSON Lines, CSV and Parquet."""
+
+import csv
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TextIO
+
+from .client import NotionClientWrapper
+from .filters import CompiledFilter
+from .formatters import OutputFormatter
+from .notion_data import format_date_cell, format_list_cell
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+
+# Column holding each entry's page ID, so exported rows can be traced back
+ID_COLUMN = "_id"
+
+# Rows buffered before a Parquet row group is written
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+# Property types whose simplified value is a list of names or IDs
+_LIST_TYPES = ("multi_select", "relation", "people")
+
+
+def detect_export_format(file_path: str) -> str:
+    """Guess the export format of a file from its extension."""
+    suffix = Path(file_path).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    if suffix == ".csv":
+        return "csv"
+    return "jsonl"
+
+
+def _text(value: Any) -> str | None:
+    """Return a value as text, JSON-encoding anything that isn't already a string."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _csv_value(value: Any) -> Any:
+    """Flatten a simplified property value into a single CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        # Same cell formats `db import` reads back
+        return format_list_cell(value)
+    if isinstance(value, dict) and set(value) == {"start", "end"}:
+        return format_date_cell(value)
+    return value if isinstance(value, (str, int, float)) else _text(value)
+
+
+class _JSONLWriter:
+    """Writes one JSON object per line."""
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+
+    def write(self, row: dict[str, Any]) -> None:
+        self.file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+    def close(self) -> None:
+        pass
+
+
+class _CSVWriter:
+    """Writes rows under a header of the exported columns."""
+
+    def __init__(self, file: TextIO, columns: list[str]) -> None:
+        self.writer = csv.DictWriter(file, columns, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, row: dict[str, Any]) -> None:
+        self.writer.writerow({column: _csv_value(value) for column, value in row.items()})
+
+    def close(self) -> None:
+        pass
+
+
+class _ParquetWriter:
+    """Buffers rows column by column and writes them out in row groups."""
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str],
+        properties: dict[str, Any],
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+    ) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception(
+                "Parquet export needs pyarrow. Install with: pip install notion-cli[parquet]"
+            ) from None
+
+        self.pa = pa
+        self.row_group_size = row_group_size
+        self.types = {ID_COLUMN: "id"}
+        self.types.update({name: properties[name].get("type", "") for name in columns[1:]})
+        self.schema = pa.schema(
+            [(name, self._arrow_type(kind)) for name, kind in self.types.items()]
+        )
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.buffer: dict[str, list[Any]] = {name: [] for name in columns}
+        self.buffered = 0
+
+    def _arrow_type(self, kind: str) -> Any:
+        """Return the Arrow type of a Notion property type's simplified values."""
+        pa = self.pa
+        if kind == "number":
+            return pa.float64()
+        if kind == "checkbox":
+            return pa.bool_()
+        if kind in _LIST_TYPES:
+            return pa.list_(pa.string())
+        if kind == "date":
+            return pa.struct([("start", pa.string()), ("end", pa.string())])
+        if kind == "files":
+            return pa.list_(pa.struct([("name", pa.string()), ("url", pa.string())]))
+        # Text-like types, plus anything else stored as JSON text
+        return pa.string()
+
+    def write(self, row: dict[str, Any]) -> None:
+        for name, values in self.buffer.items():
+            value = row.get(name)
+            kind = self.types[name]
+            if kind not in ("number", "checkbox", "date", "files", *_LIST_TYPES):
+                value = _text(value)
+            values.append(value)
+        self.buffered += 1
+        if self.buffered >= self.row_group_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered rows as one row group."""
+        if not self.buffered:
+            return
+        self.writer.write_table(self.pa.Table.from_pydict(self.buffer, schema=self.schema))
+        for values in self.buffer.values():
+            values.clear()
+        self.buffered = 0
+
+    def close(self) -> None:
+        self._flush()
+        self.writer.close()
+
+
+class EntryExporter:
+    """Streams the entries of a database query to a file, one page of results at a time.
+
+    Rows are written as soon as their page of query results arrives, so memory
+    stays flat however many entries the database holds. Property values are
+    simplified the same way as in ``--json`` output.
+    """
+
+    def __init__(
+        self,
+        client: NotionClientWrapper,
+        database: dict[str, Any],
+        file_format: str,
+        columns: list[str] | None = None,
+    ) -> None:
+        """Initialize the exporter for a database object.
+
+        Args:
+            client: Client to query the database with
+            database: Database object whose entries are exported
+            file_format: One of ``EXPORT_FORMATS``
+            columns: Properties to export, in order (default: all of them)
+        """
+        self.client = client
+        self.database_id = database.get("id", "")
+        self.properties = database.get("properties", {})
+        self.file_format = file_format
+        self.columns = columns or list(self.properties)
+        unknown = [name for name in self.columns if name not in self.properties]
+        if unknown:
+            raise Exception(f"Unknown properties: {', '.join(unknown)}")
+        self.row_count = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Export throughput so far."""
+        return self.row_count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def run(
+        self,
+        output: Path | TextIO,
+        query_filter: CompiledFilter | None = None,
+        limit: int | None = None,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> None:
+        """Export every entry matching the filter.
+
+        Args:
+            output: File to write, or an open text stream for JSON Lines and CSV
+            query_filter: Compiled filter selecting the entries
+            limit: Maximum number of entries to export
+            on_progress: Called with the number of rows written after each page
+        """
+        if isinstance(output, Path) and self.file_format != "parquet":
+            with open(output, "w", newline="", encoding="utf-8") as f:
+                self.run(f, query_filter, limit, on_progress)
+            return
+
+        columns = [ID_COLUMN, *self.columns]
+        writer: _JSONLWriter | _CSVWriter | _ParquetWriter
+        if self.file_format == "parquet":
+            if not isinstance(output, Path):
+                raise Exception("Parquet can only be exported to a file")
+            writer = _ParquetWriter(output, columns, self.properties)
+        elif self.file_format == "csv":
+            writer = _CSVWriter(output, columns)
+        else:
+            writer = _JSONLWriter(output)
+
+        # Only download the exported properties, plus any the filter checks locally
+        names = list(self.columns)
+        exact = query_filter is None or query_filter.exact
+        if not exact:
+            names += sorted(query_filter.properties - set(names))
+        projection = [self.properties[name].get("id", name) for name in names]
+
+        started = time.monotonic()
+        try:
+            for response in self.client.iter_database_pages(
+                self.database_id,
+                limit if exact else None,
+                query_filter.server if query_filter else None,
+                filter_properties=projection,
+            ):
+                entries = response.get("results", [])
+                for entry in query_filter.post_filter(entries) if query_filter else entries:
+                    values = OutputFormatter._extract_simple_properties(entry.get("properties", {}))
+                    row = {name: values.get(name) for name in self.columns}
+                    writer.write({ID_COLUMN: entry.get("id"), **row})
+                    self.row_count += 1
+                    if self.row_count == limit:
+                        break
+                self.elapsed = time.monotonic() - started
+                if on_progress:
+                    on_progress(self.row_count)
+                if self.row_count == limit:
+                    break
+        finally:
+            writer.close()
+            self.elapsed = time.monotonic() - started
@@ -1,7 +1,11 @@
 """Filter parsing and conversion for Notion CLI."""
 
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any, Union
+from typing import Any, NamedTuple, Union
+
+# A compiled filter: whether a page object matches
+Predicate = Callable[[dict[str, Any]], bool]
 
 
 @dataclass
@@ -320,25 +324,7 @@ class NotionFilterConverter:
         properties: dict[str, Any],
     ) -> dict[str, Any]:
         """Convert a single condition to Notion format."""
-        # Find the property
-        prop_data = None
-        prop_name = None
-
-        # Try exact match first
-        if condition.column in properties:
-            prop_name = condition.column
-            prop_data = properties[condition.column]
-        else:
-            # Try case-insensitive match
-            for name, data in properties.items():
-                if name.lower() == condition.column.lower():
-                    prop_name = name
-                    prop_data = data
-                    break
-
-        if not prop_data:
-            raise ValueError(f"Property '{condition.column}' not found")
-
+        prop_name, prop_data = self._find_property(condition.column, properties)
         prop_type = prop_data.get("type", "")
 
         # Convert based on property type and operator
@@ -349,6 +335,23 @@ class NotionFilterConverter:
             condition.value,
         )
 
+    def _find_property(
+        self,
+        column: str,
+        properties: dict[str, Any],
+    ) -> tuple[str, dict[str, Any]]:
+        """Find the property a condition's column refers to."""
+        # Try exact match first
+        if column in properties and properties[column]:
+            return column, properties[column]
+
+        # Try case-insensitive match
+        for name, data in properties.items():
+            if name.lower() == column.lower() and data:
+                return name, data
+
+        raise ValueError(f"Property '{column}' not found")
+
     def _convert_group(
         self,
         group: LogicalGroup,
@@ -658,17 +661,415 @@ class NotionFilterConverter:
 
     def _invert_condition(self, condition: dict[str, Any]) -> dict[str, Any]:
         """Invert a condition for NOT operations."""
-        # This is a simplified inversion - Notion's API has limitations
-        # For complex cases, we might need to restructure the query
-        if "and" in condition:
-            # NOT(A AND B) = NOT(A) OR NOT(B)
-            inverted = [self._invert_condition(c) for c in condition["and"]]
-            return {"or": inverted}
-        elif "or" in condition:
-            # NOT(A OR B) = NOT(A) AND NOT(B)
-            inverted = [self._invert_condition(c) for c in condition["or"]]
-            return {"and": inverted}
-        else:
-            # For atomic conditions, we need to map to opposite operations
-            # This is complex and may not be fully supported by Notion API
-            return condition  # Simplified - return original
+        inverted = invert_notion_filter(condition)
+        if inverted is None:
+            raise ValueError(
+                "NOT of this condition can't be expressed as a Notion filter; "
+                "use 'db show' to evaluate it locally"
+            )
+        return inverted
+
+
+class CompiledFilter(NamedTuple):
+    """A parsed filter split into what the API can evaluate and what runs locally.
+
+    ``server`` selects a superset of the matching entries (None selects every
+    entry) and ``predicate`` decides exactly whether an entry matches. When
+    ``exact`` is true, the server filter alone is exact and the entries it
+    returns need no post-filtering.
+    """
+
+    server: dict[str, Any] | None
+    predicate: Predicate
+    exact: bool
+    # Names of the properties the predicate reads
+    properties: frozenset[str]
+
+    def post_filter(self, entries: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Yield the entries that match, skipping the check if the server filter is exact."""
+        if self.exact:
+            return iter(entries)
+        return (entry for entry in entries if self.predicate(entry))
+
+
+class FilterCompiler:
+    """Compiles parsed filter conditions into a local predicate and a server-side filter.
+
+    Conditions the API supports are pushed down to it. The rest, such as a
+    NOT without an exact Notion inverse or an operator the API lacks for a
+    property type, are left out of the server filter and evaluated locally on
+    the entries it returns.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the compiler."""
+        self.converter = NotionFilterConverter()
+
+    def compile(
+        self,
+        conditions: FilterCondition | LogicalGroup | list[FilterCondition],
+        properties: dict[str, Any],
+    ) -> CompiledFilter:
+        """Compile parsed conditions against a database schema."""
+        if isinstance(conditions, list):
+            if not conditions:
+                return CompiledFilter(None, lambda entry: True, True, frozenset())
+            if len(conditions) > 1:
+                return self._compile_group(LogicalGroup("AND", list(conditions)), properties)
+            conditions = conditions[0]
+
+        if isinstance(conditions, LogicalGroup):
+            return self._compile_group(conditions, properties)
+        return self._compile_condition(conditions, properties)
+
+    def _compile_condition(
+        self,
+        condition: FilterCondition,
+        properties: dict[str, Any],
+    ) -> CompiledFilter:
+        """Compile a single condition, pushing it down if the API supports it."""
+        prop_name, prop_data = self.converter._find_property(condition.column, properties)
+        prop_type = prop_data.get("type", "")
+        names = frozenset([prop_name])
+
+        try:
+            server = self.converter._build_notion_condition(
+                prop_name, prop_type, condition.operator, condition.value
+            )
+        except ValueError:
+            predicate = _compile_local_condition(
+                prop_name, prop_type, condition.operator, condition.value
+            )
+            return CompiledFilter(None, predicate, False, names)
+
+        return CompiledFilter(server, compile_notion_filter(server), True, names)
+
+    def _compile_group(self, group: LogicalGroup, properties: dict[str, Any]) -> CompiledFilter:
+        """Compile a logical group from its compiled conditions."""
+        parts = [self.compile(condition, properties) for condition in group.conditions]
+        names = frozenset().union(*(part.properties for part in parts))
+        predicates = [part.predicate for part in parts]
+        exact = all(part.exact for part in parts)
+        servers = [part.server for part in parts]
+
+        if group.operator == "AND":
+            # Dropping a condition the API can't evaluate still leaves a superset
+            pushed = [server for server in servers if server is not None]
+            server = None
+            if pushed:
+                server = pushed[0] if len(pushed) == 1 else {"and": pushed}
+            return CompiledFilter(
+                server, lambda entry: all(p(entry) for p in predicates), exact, names
+            )
+
+        if group.operator == "OR":
+            # One condition the API can't evaluate means any entry may match
+            server = None
+            if None not in servers:
+                server = servers[0] if len(servers) == 1 else {"or": servers}
+            return CompiledFilter(
+                server, lambda entry: any(p(entry) for p in predicates), exact, names
+            )
+
+        if group.operator == "NOT":
+            # NOT with multiple conditions = NOT(OR(...)), as in NotionFilterConverter
+            inner = self._compile_group(LogicalGroup("OR", group.conditions), properties)
+            server = None
+            # Inverting a superset would lose matches, so only exact filters are inverted
+            if inner.exact and inner.server is not None:
+                server = invert_notion_filter(inner.server)
+            return CompiledFilter(
+                server,
+                lambda entry: not inner.predicate(entry),
+                server is not None,
+                names,
+            )
+
+        raise ValueError(f"Unknown logical operator: {group.operator}")
+
+
+# Operators whose inverse is a single condition that also agrees on empty values
+_INVERSE_OPERATORS = {
+    "equals": "does_not_equal",
+    "does_not_equal": "equals",
+    "contains": "does_not_contain",
+    "does_not_contain": "contains",
+    "is_empty": "is_not_empty",
+    "is_not_empty": "is_empty",
+}
+
+# Comparisons never match an empty value, so their inverse must also match empty ones
+_INVERSE_COMPARISONS = {
+    "greater_than": "less_than_or_equal_to",
+    "less_than": "greater_than_or_equal_to",
+    "greater_than_or_equal_to": "less_than",
+    "less_than_or_equal_to": "greater_than",
+    "before": "on_or_after",
+    "after": "on_or_before",
+    "on_or_before": "after",
+    "on_or_after": "before",
+}
+
+
+def invert_notion_filter(notion_filter: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the exact negation of a Notion API filter, or None if there is none."""
+    if "and" in notion_filter or "or" in notion_filter:
+        # NOT(A AND B) = NOT(A) OR NOT(B), and vice versa
+        combinator = "and" if "and" in notion_filter else "or"
+        inverted = [invert_notion_filter(c) for c in notion_filter[combinator]]
+        if any(c is None for c in inverted):
+            return None
+        return {"or" if combinator == "and" else "and": inverted}
+
+    base = {key: notion_filter[key] for key in ("property", "timestamp") if key in notion_filter}
+    filter_type = next((key for key in notion_filter if key not in base), None)
+    if filter_type is None or not notion_filter[filter_type]:
+        return None
+    operator, operand = next(iter(notion_filter[filter_type].items()))
+
+    def condition(op: str, value: Any = True) -> dict[str, Any]:
+        return {**base, filter_type: {op: value}}
+
+    if filter_type == "date" and operator == "equals":
+        # Notion has no date does_not_equal
+        return {
+            "or": [condition("before", operand), condition("after", operand), condition("is_empty")]
+        }
+    if operator in _INVERSE_OPERATORS:
+        return condition(_INVERSE_OPERATORS[operator], operand)
+    if operator in _INVERSE_COMPARISONS and "property" in base:
+        return {"or": [condition(_INVERSE_COMPARISONS[operator], operand), condition("is_empty")]}
+    return None
+
+
+def compile_notion_filter(notion_filter: dict[str, Any] | None) -> Predicate:
+    """Compile a Notion API filter into a predicate matching page objects like a query would.
+
+    Covers the conditions ``NotionFilterConverter`` produces plus timestamp
+    filters, so queries can be answered from the local mirror.
+    """
+    if not notion_filter:
+        return lambda entry: True
+    if "and" in notion_filter:
+        all_of = [compile_notion_filter(c) for c in notion_filter["and"]]
+        return lambda entry: all(p(entry) for p in all_of)
+    if "or" in notion_filter:
+        any_of = [compile_notion_filter(c) for c in notion_filter["or"]]
+        return lambda entry: any(p(entry) for p in any_of)
+
+    if "timestamp" in notion_filter:
+        timestamp = notion_filter["timestamp"]
+        date_condition = notion_filter.get(timestamp, {})
+        return lambda entry: _match_date(entry.get(timestamp), date_condition)
+
+    prop_name = notion_filter.get("property")
+    filter_type, condition = next(
+        (key, value) for key, value in notion_filter.items() if key != "property"
+    )
+    return lambda entry: _match_property(
+        entry.get("properties", {}).get(prop_name, {}), filter_type, condition
+    )
+
+
+def _compile_local_condition(
+    prop_name: str,
+    prop_type: str,
+    operator: str,
+    value: str,
+) -> Predicate:
+    """Compile a condition the API can't express for its property type.
+
+    The property's simplified values are compared case-insensitively: as
+    numbers when both sides are numeric, otherwise as text. A multi-value
+    property matches if any of its values does.
+    """
+    negated = operator in ("!=", "!~", "not in")
+    positive = {"!=": "=", "!~": "~", "not in": "in"}.get(operator, operator)
+    if positive not in ("=", "~", "in", ">", "<", ">=", "<="):
+        raise ValueError(f"Unknown operator: {operator}")
+
+    if positive == "in":
+        operands = [v.strip().strip("'\"") for v in value.split(",")]
+    else:
+        operands = [value]
+
+    numbers = [_as_number(operand) for operand in operands]
+    if prop_type == "number" and positive in ("=", ">", "<", ">=", "<=") and None in numbers:
+        raise ValueError(f"Invalid number value: {value}")
+
+    def compare(item: Any, operand: str, number: float | None) -> int:
+        item_number = _as_number(item)
+        if item_number is not None and number is not None:
+            return (item_number > number) - (item_number < number)
+        left, right = str(item).casefold(), operand.casefold()
+        return (left > right) - (left < right)
+
+    def test(item: Any) -> bool:
+        if positive == "~":
+            return operands[0].casefold() in str(item).casefold()
+        if positive in ("=", "in"):
+            return any(
+                compare(item, operand, number) == 0
+                for operand, number in zip(operands, numbers, strict=True)
+            )
+        order = compare(item, operands[0], numbers[0])
+        return {">": order > 0, "<": order < 0, ">=": order >= 0, "<=": order <= 0}[positive]
+
+    def predicate(entry: dict[str, Any]) -> bool:
+        items = _simple_values(entry.get("properties", {}).get(prop_name, {}))
+        return any(test(item) for item in items) != negated
+
+    return predicate
+
+
+def _as_number(value: Any) -> float | None:
+    """Return a value as a number, if it is one."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _simple_values(prop_data: dict[str, Any]) -> list[Any]:
+    """Return the values of a property for local comparison; empty properties have none."""
+    prop_type = prop_data.get("type", "")
+    value = prop_data.get(prop_type)
+    if prop_type in ("multi_select", "people"):
+        return [item.get("name") or item.get("id", "") for item in value or []]
+    if prop_type == "relation":
+        return [item.get("id", "") for item in value or []]
+    if prop_type == "checkbox":
+        return ["true" if value else "false"]
+    if prop_type == "number":
+        return [] if value is None else [value]
+    if prop_type == "date":
+        return [value["start"]] if isinstance(value, dict) and value.get("start") else []
+    text = _plain_text(prop_data)
+    return [text] if text else []
+
+
+def _match_property(prop_data: dict[str, Any], filter_type: str, condition: dict[str, Any]) -> bool:
+    """Evaluate one property condition such as ``{"equals": "Done"}``."""
+    prop_type = prop_data.get("type", "")
+    value = prop_data.get(prop_type)
+
+    if filter_type in ("title", "rich_text"):
+        return _match_text(_plain_text(prop_data), condition)
+    if filter_type in ("select", "status"):
+        name = value.get("name") if isinstance(value, dict) else None
+        return _match_equality(name, condition)
+    if filter_type == "multi_select":
+        names = [item.get("name") for item in value or []]
+        operator, operand = next(iter(condition.items()))
+        if operator == "contains":
+            return operand in names
+        if operator == "does_not_contain":
+            return operand not in names
+        return _match_emptiness(names, operator)
+    if filter_type == "checkbox":
+        return _match_equality(bool(value), condition)
+    if filter_type == "number":
+        return _match_number(value, condition)
+    if filter_type == "date":
+        return _match_date(value.get("start") if isinstance(value, dict) else None, condition)
+    raise ValueError(f"Filter type '{filter_type}' can't be evaluated locally")
+
+
+def _plain_text(prop_data: dict[str, Any]) -> str:
+    """Return the text of a property, as text filters see it."""
+    prop_type = prop_data.get("type", "")
+    value = prop_data.get(prop_type)
+    if isinstance(value, list):
+        return "".join(item.get("plain_text", "") for item in value if isinstance(item, dict))
+    if isinstance(value, dict):
+        return str(value.get("name") or value.get("string") or "")
+    return "" if value is None else str(value)
+
+
+def _match_emptiness(value: Any, operator: str) -> bool:
+    """Evaluate ``is_empty`` and ``is_not_empty``."""
+    if operator == "is_empty":
+        return not value
+    if operator == "is_not_empty":
+        return bool(value)
+    raise ValueError(f"Filter operator '{operator}' can't be evaluated locally")
+
+
+def _match_equality(value: Any, condition: dict[str, Any]) -> bool:
+    """Evaluate ``equals``, ``does_not_equal`` and emptiness conditions."""
+    operator, operand = next(iter(condition.items()))
+    if operator == "equals":
+        return value == operand
+    if operator == "does_not_equal":
+        return value != operand
+    return _match_emptiness(value, operator)
+
+
+def _match_text(text: str, condition: dict[str, Any]) -> bool:
+    """Evaluate a text condition; like Notion, only ``equals`` is case-sensitive."""
+    operator, operand = next(iter(condition.items()))
+    if operator in ("equals", "does_not_equal"):
+        return _match_equality(text, condition)
+    if operator in ("is_empty", "is_not_empty"):
+        return _match_emptiness(text, operator)
+
+    text, operand = text.casefold(), str(operand).casefold()
+    if operator == "contains":
+        return operand in text
+    if operator == "does_not_contain":
+        return operand not in text
+    if operator == "starts_with":
+        return text.startswith(operand)
+    if operator == "ends_with":
+        return text.endswith(operand)
+    raise ValueError(f"Filter operator '{operator}' can't be evaluated locally")
+
+
+def _match_number(value: float | None, condition: dict[str, Any]) -> bool:
+    """Evaluate a number condition; empty numbers only match ``does_not_equal``."""
+    operator, operand = next(iter(condition.items()))
+    if operator in ("equals", "does_not_equal", "is_empty", "is_not_empty"):
+        return _match_equality(value, condition)
+    if value is None:
+        return False
+    if operator == "greater_than":
+        return value > operand
+    if operator == "less_than":
+        return value < operand
+    if operator == "greater_than_or_equal_to":
+        return value >= operand
+    if operator == "less_than_or_equal_to":
+        return value <= operand
+    raise ValueError(f"Filter operator '{operator}' can't be evaluated locally")
+
+
+def _match_date(value: str | None, condition: dict[str, Any]) -> bool:
+    """Evaluate a date condition on an ISO 8601 date or timestamp.
+
+    A date-only operand is compared against the day of the value, so
+    ``equals: 2025-07-10`` matches any time that day.
+    """
+    operator, operand = next(iter(condition.items()))
+    if operator in ("is_empty", "is_not_empty"):
+        return _match_emptiness(value, operator)
+    if not value:
+        return operator == "does_not_equal"
+
+    operand = str(operand)
+    if len(operand) == 10:
+        value = value[:10]
+    if operator == "equals":
+        return value == operand
+    if operator == "does_not_equal":
+        return value != operand
+    if operator == "before":
+        return value < operand
+    if operator == "after":
+        return value > operand
+    if operator == "on_or_before":
+        return value <= operand
+    if operator == "on_or_after":
+        return value >= operand
+    raise ValueError(f"Filter operator '{operator}' can't be evaluated locally")
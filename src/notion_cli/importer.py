@@ -0,0 +1,240 @@
+"""Streaming import of CSV and JSON Lines files into a database."""
+
+import csv
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+from .bulk import BulkResult, BulkUpdater
+from .client import NotionClientWrapper
+from .notion_data import READ_ONLY_PROPERTY_TYPES, NotionDataConverter, parse_date_cell
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+# Column added to rejected rows to explain why they failed
+ERROR_COLUMN = "_error"
+
+# Property types an import can't set: computed ones, and those holding page,
+# user or upload IDs that a name in a file can't be turned back into
+SKIPPED_PROPERTY_TYPES = (*READ_ONLY_PROPERTY_TYPES, "relation", "people", "files")
+
+
+def detect_format(file_path: str) -> str:
+    """Guess the import format of a file from its extension."""
+    if Path(file_path).suffix.lower() in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "csv"
+
+
+def default_rejects_path(file_path: str) -> Path:
+    """Return where rejected rows go by default: ``name.rejects.ext`` next to the input."""
+    path = Path(file_path)
+    return path.with_name(f"{path.stem}.rejects{path.suffix}")
+
+
+class RejectsWriter:
+    """Writes rows that could not be imported, with the reason, in the input's format.
+
+    The file is only created once the first row is rejected.
+    """
+
+    def __init__(self, path: Path, file_format: str) -> None:
+        """Initialize the writer."""
+        self.path = path
+        self.file_format = file_format
+        self.count = 0
+        self.fieldnames: list[str] = []
+        self._file: TextIO | None = None
+        self._writer: csv.DictWriter[str] | None = None
+
+    def write(self, row: dict[str, Any] | str, error: str) -> None:
+        """Write a rejected row; ``row`` is the raw line if it could not be parsed."""
+        if self._file is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            if self.file_format == "csv":
+                self._writer = csv.DictWriter(
+                    self._file, [*self.fieldnames, ERROR_COLUMN], extrasaction="ignore"
+                )
+                self._writer.writeheader()
+
+        if self._writer is not None and isinstance(row, dict):
+            self._writer.writerow({**row, ERROR_COLUMN: error})
+        else:
+            record = row if isinstance(row, dict) else {"_line": row}
+            self._file.write(json.dumps({**record, ERROR_COLUMN: error}) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        """Close the rejects file, if it was created."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class EntryImporter:
+    """Creates database entries from the rows of a CSV or JSON Lines file.
+
+    Columns are matched to properties by name, falling back to a case-insensitive
+    match, and converted with NotionDataConverter. Rows are read from disk as
+    they are created, several at a time, so memory stays flat however long the
+    file is. Rows that can't be converted or created go to a rejects file.
+    """
+
+    def __init__(
+        self,
+        client: NotionClientWrapper,
+        database: dict[str, Any],
+        file_format: str,
+        rejects_path: Path,
+    ) -> None:
+        """Initialize the importer for a database object."""
+        self.client = client
+        self.database_id = database.get("id", "")
+        self.properties = database.get("properties", {})
+        self.file_format = file_format
+        self.rejects = RejectsWriter(rejects_path, file_format)
+        self.created_count = 0
+        # Column name -> property name, or None for columns without a property
+        self.columns: dict[str, str | None] = {}
+
+    @property
+    def ignored_columns(self) -> list[str]:
+        """Columns seen so far that match no property."""
+        return [column for column, prop_name in self.columns.items() if prop_name is None]
+
+    @property
+    def skipped_columns(self) -> list[str]:
+        """Columns seen so far whose property can't be set, such as formulas or relations."""
+        return [
+            column
+            for column, prop_name in self.columns.items()
+            if prop_name is not None and self._is_skipped(prop_name)
+        ]
+
+    def run(
+        self,
+        file_path: str,
+        on_result: Callable[[BulkResult], None] | None = None,
+    ) -> None:
+        """Import every row of a file.
+
+        Args:
+            file_path: CSV or JSON Lines file with one entry per row
+            on_result: Called in the calling thread as each row is created or
+                rejected; the result's key is the row number
+        """
+        in_flight: dict[str, dict[str, Any]] = {}
+
+        def reject(label: str, row: dict[str, Any] | str, error: str) -> None:
+            self.rejects.write(row, error)
+            if on_result:
+                on_result(BulkResult(label, error=error))
+
+        def entries() -> Iterator[tuple[str, dict[str, Any]]]:
+            for label, row, error in self._read_rows(file_path):
+                if error:
+                    reject(label, row, error)
+                    continue
+                try:
+                    notion_properties = self._convert(row)
+                except ValueError as e:
+                    reject(label, row, str(e))
+                    continue
+                if not notion_properties:
+                    reject(label, row, "No values match the database properties")
+                    continue
+                in_flight[label] = row
+                yield label, notion_properties
+
+        def record(result: BulkResult) -> None:
+            row = in_flight.pop(result.key)
+            if result.ok:
+                self.created_count += 1
+            else:
+                self.rejects.write(row, result.error or "")
+            if on_result:
+                on_result(result)
+
+        try:
+            BulkUpdater(self.client).run(
+                entries(),
+                lambda entry: self.client.create_page(self.database_id, entry[1]),
+                record,
+                keep_results=False,
+                key=lambda entry: entry[0],
+            )
+        finally:
+            self.rejects.close()
+
+    def _read_rows(self, file_path: str) -> Iterator[tuple[str, Any, str | None]]:
+        """Yield ``(row number, row, error)`` for each row of the file, one at a time."""
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            if self.file_format == "csv":
+                reader = csv.DictReader(f)
+                self.rejects.fieldnames = list(reader.fieldnames or [])
+                for number, row in enumerate(reader, start=1):
+                    yield str(number), row, None
+                return
+
+            for number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    yield str(number), line.rstrip("\n"), f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(row, dict):
+                    yield str(number), line.rstrip("\n"), "Expected a JSON object"
+                    continue
+                yield str(number), row, None
+
+    def _convert(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Convert a row to Notion properties.
+
+        Columns of properties the import can't set are left out.
+
+        Raises:
+            ValueError: If a number or date value can't be parsed, instead of
+                creating the entry without it
+        """
+        data = {}
+        for column, value in row.items():
+            prop_name = self._property_for(column)
+            # CSV has no nulls, so an empty cell leaves the property unset
+            if prop_name is None or value is None or value == "" or self._is_skipped(prop_name):
+                continue
+            if self.properties[prop_name].get("type") == "date":
+                try:
+                    value = parse_date_cell(value)
+                except ValueError as e:
+                    raise ValueError(f"Invalid value for {prop_name}: {e}")
+            data[prop_name] = value
+
+        notion_properties = NotionDataConverter.convert_to_notion_properties(data, self.properties)
+        for prop_name, value in data.items():
+            # The converter silently leaves out numbers it can't parse
+            prop_type = self.properties[prop_name].get("type")
+            if prop_type == "number" and prop_name not in notion_properties:
+                raise ValueError(f"Invalid value for {prop_name}: {value!r} is not a number")
+        return notion_properties
+
+    def _is_skipped(self, prop_name: str) -> bool:
+        """Whether a property is of a type the import can't set."""
+        return self.properties[prop_name].get("type") in SKIPPED_PROPERTY_TYPES
+
+    def _property_for(self, column: str | None) -> str | None:
+        """Return the property a column maps to, if any."""
+        if column is None:
+            # Extra CSV cells beyond the header
+            return None
+        if column not in self.columns:
+            prop_name = column if column in self.properties else None
+            if prop_name is None:
+                prop_name = next(
+                    (name for name in self.properties if name.lower() == column.strip().lower()),
+                    None,
+                )
+            self.columns[column] = prop_name
+        return self.columns[column]
@@ -0,0 +1,329 @@
+"""Local indexes for resolving names and titles without API calls."""
+
+import json
+import os
+import sqlite3
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from platformdirs import user_cache_dir, user_config_dir
+
+from .cache import _SQLiteCache
+
+# Trie key under which a node stores the entries whose name ends there
+TERMINAL = "\0"
+
+# Trigram similarity from which a title counts as a fuzzy match
+SIMILARITY_THRESHOLD = 0.3
+
+
+class IndexEntry(NamedTuple):
+    """A database name known to the index."""
+
+    name: str
+    database_id: str
+    alias: bool = False
+
+
+def _insert(trie: dict[str, Any], name: str, database_id: str) -> bool:
+    """Add a name to a trie, keyed by its lowercase characters.
+
+    Returns:
+        Whether the entry was new
+    """
+    node = trie
+    for char in name.lower():
+        node = node.setdefault(char, {})
+    entries = node.setdefault(TERMINAL, [])
+    if [name, database_id] in entries:
+        return False
+    entries.append([name, database_id])
+    return True
+
+
+def _find_node(trie: dict[str, Any], prefix: str) -> dict[str, Any] | None:
+    """Return the trie node reached by a prefix, if any."""
+    node = trie
+    for char in prefix.lower():
+        node = node.get(char)
+        if node is None:
+            return None
+    return node
+
+
+def _collect(node: dict[str, Any]) -> list[list[str]]:
+    """Return every entry stored at or below a trie node, shortest names first."""
+    entries: list[list[str]] = []
+    level = [node]
+    while level:
+        next_level = []
+        for current in level:
+            for key, child in sorted(current.items()):
+                if key == TERMINAL:
+                    entries.extend(child)
+                else:
+                    next_level.append(child)
+        level = next_level
+    return entries
+
+
+class DatabaseIndex:
+    """Prefix trie over database titles and configured aliases.
+
+    Titles are learned from workspace searches and persisted as JSON next to
+    the config file. Aliases come from ``NotionConfig.databases`` and only live
+    in memory, since the config file is their source of truth.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        aliases: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the index, loading persisted titles if present."""
+        if path:
+            self.path = path
+        else:
+            config_dir = Path(user_config_dir("notion", "notion"))
+            self.path = config_dir / "database_index.json"
+
+        self.titles = self._load()
+        self.aliases: dict[str, Any] = {}
+        for name, database_id in (aliases or {}).items():
+            _insert(self.aliases, name, database_id)
+
+    def _load(self) -> dict[str, Any]:
+        """Load the persisted title trie, starting empty if it is missing or corrupt."""
+        try:
+            with open(self.path) as f:
+                trie = json.load(f)
+            return trie if isinstance(trie, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self) -> None:
+        """Persist the title trie atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self.titles, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+    def rebuild(self, databases: Iterable[tuple[str, str]]) -> None:
+        """Replace the indexed titles with ``(title, database_id)`` pairs from a search."""
+        trie: dict[str, Any] = {}
+        for title, database_id in databases:
+            if title and database_id:
+                _insert(trie, title, database_id)
+
+        if trie != self.titles:
+            self.titles = trie
+            self._save()
+
+    def add(self, databases: Iterable[tuple[str, str]]) -> None:
+        """Add ``(title, database_id)`` pairs without dropping existing entries."""
+        changed = False
+        for title, database_id in databases:
+            if title and database_id:
+                changed = _insert(self.titles, title, database_id) or changed
+
+        if changed:
+            self._save()
+
+    def remove(self, database_id: str) -> None:
+        """Forget a database, e.g. after it was deleted or unshared."""
+
+        def prune(node: dict[str, Any]) -> bool:
+            for key in list(node):
+                if key == TERMINAL:
+                    node[key] = [entry for entry in node[key] if entry[1] != database_id]
+                    if not node[key]:
+                        del node[key]
+                elif prune(node[key]):
+                    del node[key]
+            return not node
+
+        prune(self.titles)
+        self._save()
+
+    def find(self, name: str) -> list[IndexEntry]:
+        """Return the databases whose alias or title equals ``name`` (case-insensitive)."""
+        return self._entries(name, exact=True)
+
+    def find_prefix(self, prefix: str) -> list[IndexEntry]:
+        """Return the databases whose alias or title starts with ``prefix``."""
+        return self._entries(prefix, exact=False)
+
+    def _entries(self, name: str, exact: bool) -> list[IndexEntry]:
+        """Look up a name in both tries, aliases first, one entry per database."""
+        results: list[IndexEntry] = []
+        seen: set[str] = set()
+        for trie, alias in ((self.aliases, True), (self.titles, False)):
+            node = _find_node(trie, name)
+            if node is None:
+                continue
+            entries = node.get(TERMINAL, []) if exact else _collect(node)
+            for entry_name, database_id in entries:
+                if database_id not in seen:
+                    seen.add(database_id)
+                    results.append(IndexEntry(entry_name, database_id, alias))
+        return results
+
+
+def trigrams(text: str) -> set[str]:
+    """Split text into lowercase character trigrams, padding each word with spaces."""
+    grams: set[str] = set()
+    for word in text.lower().split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(query: str, title: str) -> float:
+    """Return the Dice coefficient of the trigram sets of two strings."""
+    query_grams = trigrams(query)
+    title_grams = trigrams(title)
+    total = len(query_grams) + len(title_grams)
+    return 2.0 * len(query_grams & title_grams) / total if total else 0.0
+
+
+class TitleIndex(_SQLiteCache):
+    """Persisted trigram index over page and database entry titles.
+
+    Objects are grouped in scopes (``pages`` for workspace pages, ``db:<id>``
+    for the entries of a database). The index only holds the objects it was
+    given: lookups add the candidates Notion returned for them, and ``db sync``
+    adds every entry of a database.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS titles (
+            scope TEXT NOT NULL,
+            object_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            gram_count INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (scope, object_id)
+        );
+        CREATE TABLE IF NOT EXISTS trigrams (
+            scope TEXT NOT NULL,
+            gram TEXT NOT NULL,
+            object_id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS trigrams_by_gram ON trigrams (scope, gram);
+        CREATE INDEX IF NOT EXISTS trigrams_by_object ON trigrams (scope, object_id);
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the index, defaulting to the user cache directory."""
+        super().__init__(path or Path(user_cache_dir("notion", "notion")) / "titles.db")
+
+    def update(
+        self,
+        scope: str,
+        items: list[tuple[str, dict[str, Any]]],
+        full: bool = False,
+    ) -> None:
+        """Store ``(title, object)`` pairs in a scope.
+
+        With ``full``, the items replace everything previously indexed in the scope.
+        Archived objects among the items are removed instead of stored. Objects
+        trashed, archived or unshared elsewhere stay indexed until a lookup checks
+        them against the API or they are removed explicitly.
+        """
+        try:
+            with self._connect() as conn:
+                if full:
+                    conn.execute("DELETE FROM titles WHERE scope = ?", (scope,))
+                    conn.execute("DELETE FROM trigrams WHERE scope = ?", (scope,))
+
+                for title, obj in items:
+                    object_id = obj.get("id", "")
+                    conn.execute(
+                        "DELETE FROM titles WHERE scope = ? AND object_id = ?", (scope, object_id)
+                    )
+                    conn.execute(
+                        "DELETE FROM trigrams WHERE scope = ? AND object_id = ?",
+                        (scope, object_id),
+                    )
+                    if obj.get("archived") or obj.get("in_trash"):
+                        continue
+
+                    grams = trigrams(title)
+                    conn.execute(
+                        "INSERT INTO titles VALUES (?, ?, ?, ?, ?)",
+                        (
+                            scope,
+                            object_id,
+                            title,
+                            len(grams),
+                            zlib.compress(json.dumps(obj).encode()),
+                        ),
+                    )
+                    conn.executemany(
+                        "INSERT INTO trigrams VALUES (?, ?, ?)",
+                        [(scope, gram, object_id) for gram in grams],
+                    )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def remove(self, object_id: str) -> None:
+        """Drop an object from every scope, e.g. after it was archived."""
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM titles WHERE object_id = ?", (object_id,))
+                conn.execute("DELETE FROM trigrams WHERE object_id = ?", (object_id,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def search(
+        self,
+        scope: str,
+        query: str,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> list[tuple[float, str, dict[str, Any]]]:
+        """Find titles similar to a query.
+
+        Titles are scored by the Dice coefficient of their trigram sets. Titles that
+        contain the query verbatim are always included.
+
+        Returns:
+            ``(similarity, title, object)`` tuples, most similar first
+        """
+        query_grams = trigrams(query)
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT similarity, title, data FROM ("
+                    "  SELECT t.title, t.data,"
+                    "   2.0 * COALESCE(s.shared, 0) / (? + t.gram_count) AS similarity"
+                    "  FROM titles t LEFT JOIN ("
+                    "   SELECT object_id, COUNT(*) AS shared FROM trigrams"
+                    "   WHERE scope = ? AND gram IN (SELECT value FROM json_each(?))"
+                    "   GROUP BY object_id"
+                    "  ) s ON s.object_id = t.object_id"
+                    "  WHERE t.scope = ?"
+                    " ) WHERE similarity >= ? OR instr(lower(title), ?) > 0",
+                    (
+                        len(query_grams),
+                        scope,
+                        json.dumps(sorted(query_grams)),
+                        scope,
+                        threshold,
+                        query.lower(),
+                    ),
+                ).fetchall()
+            results = [
+                (similarity, title, json.loads(zlib.decompress(data)))
+                for similarity, title, data in rows
+            ]
+        except (sqlite3.Error, OSError, ValueError, zlib.error):
+            return []
+
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results
@@ -1,8 +1,12 @@
 """Main CLI application entry point."""
 
+import itertools
 import json
+import os
 import shutil
+import sys
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -15,14 +19,19 @@ import questionary
 import typer
 from md2notionpage.core import parse_md
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
+from .bulk import BulkResult, BulkUpdater, Checkpoint
+from .cache import REFRESH_ENV_VAR
 from .client import NotionClientWrapper
-from .config import ConfigManager
-from .filters import FilterParser, NotionFilterConverter
+from .exporter import EXPORT_FORMATS, EntryExporter, detect_export_format
+from .filters import CompiledFilter, FilterCompiler, FilterParser
 from .formatters import OutputFormatter, handle_error, output_result
+from .importer import IMPORT_FORMATS, EntryImporter, default_rejects_path, detect_format
 from .llm import get_default_llm_service
 from .notion_data import NotionDataConverter
+from .session import get_client, get_session
 from .views import DatabaseView, ViewsManager
 
 app = typer.Typer(
@@ -43,6 +52,10 @@ app.add_typer(completion_app, name="completion")
 
 console = Console()
 
+# Format of the plan journaled by bulk `db edit` runs; journals in another format
+# are not resumed
+EDIT_PLAN_VERSION = 1
+
 
 @app.callback(invoke_without_command=True)
 def main_callback(
@@ -50,8 +63,14 @@ def main_callback(
     reference: bool = typer.Option(
         False, "--reference", "-r", is_flag=True, help="Show comprehensive reference documentation"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached data and fetch everything fresh from Notion"
+    ),
 ) -> None:
-    """Main callback to handle --reference flag."""
+    """Main callback to handle global flags."""
+    if refresh:
+        os.environ[REFRESH_ENV_VAR] = "1"
+
     if reference:
         # Print reference.md content using importlib.resources
         try:
@@ -68,7 +87,7 @@ def get_database_name_or_default(database_name: str | None) -> str:
     if database_name:
         return database_name
 
-    config_manager = ConfigManager()
+    config_manager = get_session().config_manager
     default_db = config_manager.get_default_database()
     if default_db:
         return default_db
@@ -80,16 +99,35 @@ def get_database_name_or_default(database_name: str | None) -> str:
 
 def resolve_database_name(name: str, interactive: bool = True) -> dict[str, Any] | None:
     """Resolve a database name (exact or prefix) to a database object."""
-    client = NotionClientWrapper()
+    client = get_client()
     return client.get_database_by_name_or_prefix(name, interactive=interactive)
 
 
+def resolve_local_database(name: str, json_output: bool = False) -> dict[str, Any]:
+    """Resolve a database name to the database object stored in its local mirror."""
+    database = get_client().get_mirrored_database(name)
+    if not database:
+        handle_error(
+            f"Database '{name}' has no local mirror. Run 'notion db sync \"{name}\"' first.",
+            json_mode=json_output,
+            console=console,
+        )
+    return database
+
+
+def compile_filter(filter_expr: str, properties: dict[str, Any]) -> CompiledFilter:
+    """Parse a filter expression and compile it against a database schema."""
+    parser = FilterParser()
+    compiler = FilterCompiler()
+    return compiler.compile(parser.parse(filter_expr), properties)
+
+
 def get_view_name_or_default(view_name: str | None) -> str:
     """Get view name or fall back to default."""
     if view_name:
         return view_name
 
-    config_manager = ConfigManager()
+    config_manager = get_session().config_manager
     default_view = config_manager.get_default_view()
     if default_view:
         return default_view
@@ -105,6 +143,89 @@ def resolve_view_name(name: str, interactive: bool = True) -> DatabaseView | Non
     return views_manager.load_view_by_name_or_prefix(name, interactive=interactive)
 
 
+def upload_files(
+    client: NotionClientWrapper,
+    files: list[str],
+    file_properties: list[str],
+    json_output: bool,
+    failures: list[tuple[str, Exception]] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Upload files for file properties, showing overall progress unless in JSON mode.
+
+    Files that fail to upload are reported, or in JSON mode added to ``failures``.
+    """
+    if json_output:
+
+        def collect(file_path: str, error: Exception | None) -> None:
+            if error and failures is not None:
+                failures.append((file_path, error))
+
+        return client.prepare_file_properties(files, file_properties, collect)
+
+    finished = 0
+    failed = 0
+    with console.status(f"📁 Uploading {len(files)} file(s) to Notion...") as status:
+
+        def on_progress(file_path: str, error: Exception | None) -> None:
+            nonlocal finished, failed
+            finished += 1
+            if error:
+                failed += 1
+                console.print(
+                    f"❌ Failed to upload {os.path.basename(file_path)}: {error}", style="red"
+                )
+            status.update(f"📁 Uploading file(s) to Notion... {finished}/{len(files)} done")
+
+        file_data = client.prepare_file_properties(files, file_properties, on_progress)
+
+    if failed < len(files):
+        console.print(f"✅ Successfully uploaded {len(files) - failed} file(s)!", style="green")
+    return file_data
+
+
+def start_file_uploads(
+    client: NotionClientWrapper,
+    files: list[str],
+) -> tuple[Future[list[dict[str, Any]]], list[tuple[str, Exception]]]:
+    """Start uploading files in the background.
+
+    Returns:
+        A future of the uploaded file objects and a list that collects failures
+    """
+    failures: list[tuple[str, Exception]] = []
+
+    def on_progress(file_path: str, error: Exception | None) -> None:
+        if error:
+            failures.append((file_path, error))
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notion-upload")
+    uploads = executor.submit(client.upload_files, files, on_progress)
+    executor.shutdown(wait=False)
+    return uploads, failures
+
+
+def finish_file_uploads(
+    uploads: Future[list[dict[str, Any]]],
+    failures: list[tuple[str, Exception]],
+    json_output: bool,
+) -> list[dict[str, Any]]:
+    """Wait for background uploads and report their outcome unless in JSON mode."""
+    if json_output:
+        return uploads.result()
+
+    if uploads.done():
+        file_objects = uploads.result()
+    else:
+        with console.status("📁 Finishing file uploads..."):
+            file_objects = uploads.result()
+
+    for file_path, error in failures:
+        console.print(f"❌ Failed to upload {os.path.basename(file_path)}: {error}", style="red")
+    if file_objects:
+        console.print(f"✅ Successfully uploaded {len(file_objects)} file(s)!", style="green")
+    return file_objects
+
+
 @auth_app.command("setup")
 def setup_auth(
     token: str = typer.Option(..., "--token", "-t", help="Notion integration token"),
@@ -112,11 +233,11 @@ def setup_auth(
 ) -> None:
     """Set up authentication with Notion integration token."""
     try:
-        config_manager = ConfigManager()
+        config_manager = get_session().config_manager
         config_manager.set_token(token)
 
         # Test the connection
-        client = NotionClientWrapper(config_manager)
+        client = get_client()
         if client.test_connection():
             if json_output:
                 OutputFormatter.output_json({
@@ -139,7 +260,7 @@ def test_auth(
 ) -> None:
     """Test the current authentication."""
     try:
-        client = NotionClientWrapper()
+        client = get_client()
         if client.test_connection():
             if json_output:
                 OutputFormatter.output_json({"authenticated": True})
@@ -160,7 +281,7 @@ def list_databases(
 ) -> None:
     """List all accessible databases."""
     try:
-        client = NotionClientWrapper()
+        client = get_client()
         databases = client.list_databases()
 
         if not databases:
@@ -207,7 +328,7 @@ def set_default_database(
             elif isinstance(database["title"], str):
                 resolved_database_name = database["title"]
 
-        config_manager = ConfigManager()
+        config_manager = get_session().config_manager
         config_manager.set_default_database(resolved_database_name)
 
         if json_output:
@@ -228,7 +349,7 @@ def get_default_database(
 ) -> None:
     """Show the current default database."""
     try:
-        config_manager = ConfigManager()
+        config_manager = get_session().config_manager
         default_db = config_manager.get_default_database()
 
         if json_output:
@@ -273,6 +394,9 @@ def show_database(
         "--save-view",
         help="Save current view with the given name",
     ),
+    local: bool = typer.Option(
+        False, "--local", help="Read entries from the local mirror (see 'notion db sync')"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """Show entries in a specific database by name."""
@@ -280,8 +404,11 @@ def show_database(
     name = get_database_name_or_default(name)
 
     try:
-        database = resolve_database_name(name, interactive=not json_output)
-        client = NotionClientWrapper()
+        if local:
+            database = resolve_local_database(name, json_output)
+        else:
+            database = resolve_database_name(name, interactive=not json_output)
+        client = get_client()
 
         if not database:
             msg = f"Database '{name}' not found."
@@ -308,13 +435,10 @@ def show_database(
             return
 
         # Parse filter if provided
-        filter_conditions = None
+        query_filter = None
         if filter_expr:
             try:
-                parser = FilterParser()
-                converter = NotionFilterConverter()
-                parsed_filters = parser.parse(filter_expr)
-                filter_conditions = converter.convert(parsed_filters, properties)
+                query_filter = compile_filter(filter_expr, properties)
                 if not json_output:
                     msg = f"\n📋 Database: {db_title} (filtered)"
                     console.print(msg, style="bold cyan")
@@ -339,18 +463,60 @@ def show_database(
                     f"🔗 Database URL: [link={database_url}]{database_url}[/link]", style="blue"
                 )
 
-        # Get all entries with filtering applied (no limit yet)
-        all_entries = client.get_database_entries(database_id, None, filter_conditions)
+        # Parse user-specified columns
+        user_columns = None
+        if columns:
+            user_columns = [col.strip() for col in columns.split(",")]
+
+        # Get terminal width for dynamic sizing
+        terminal_width = shutil.get_terminal_size().columns
 
-        # Apply limit after filtering
-        if limit is not None:
-            entries = all_entries[:limit]
-            if not json_output:
-                console.print(f"Showing {len(entries)} of {len(all_entries)} entries:\n")
+        # Calculate optimal columns and widths
+        displayed_props, column_widths = client.calculate_optimal_columns(
+            properties,
+            terminal_width,
+            user_columns,
+        )
+
+        if not displayed_props:
+            msg = "No suitable columns found to display."
+            if json_output:
+                handle_error(msg, json_mode=json_output, console=console)
+            else:
+                console.print(msg, style="yellow")
+            return
+
+        # Stream entries with filtering applied, fetching one entry past the limit
+        # to know whether more are available without reading the whole database.
+        # Only the displayed and filtered properties are downloaded.
+        fetch_limit = limit + 1 if limit is not None else None
+        if local:
+            matching = client.mirror.iter_entries(database_id)
+            if query_filter:
+                matching = filter(query_filter.predicate, matching)
         else:
-            entries = all_entries
+            projected = set(displayed_props)
+            exact = query_filter is None or query_filter.exact
+            if not exact:
+                # Conditions the API can't evaluate are checked here, before the limit
+                projected |= query_filter.properties
+            matching = client.iter_database_entries(
+                database_id,
+                fetch_limit if exact else None,
+                query_filter.server if query_filter else None,
+                filter_properties=[properties[prop].get("id", prop) for prop in projected],
+            )
+            if query_filter:
+                matching = query_filter.post_filter(matching)
+        entries = list(itertools.islice(matching, fetch_limit))
+
+        has_more = limit is not None and len(entries) > limit
+        if has_more:
+            entries = entries[:limit]
             if not json_output:
-                console.print(f"Showing all {len(entries)} entries:\n")
+                console.print(f"Showing first {len(entries)} entries (more available):\n")
+        elif not json_output:
+            console.print(f"Showing all {len(entries)} entries:\n")
 
         if not entries:
             if json_output:
@@ -373,29 +539,6 @@ def show_database(
                 console.print("No entries found in this database.", style="yellow")
             return
 
-        # Parse user-specified columns
-        user_columns = None
-        if columns:
-            user_columns = [col.strip() for col in columns.split(",")]
-
-        # Get terminal width for dynamic sizing
-        terminal_width = shutil.get_terminal_size().columns
-
-        # Calculate optimal columns and widths
-        displayed_props, column_widths = client.calculate_optimal_columns(
-            properties,
-            terminal_width,
-            user_columns,
-        )
-
-        if not displayed_props:
-            msg = "No suitable columns found to display."
-            if json_output:
-                handle_error(msg, json_mode=json_output, console=console)
-            else:
-                console.print(msg, style="yellow")
-            return
-
         # Handle JSON output mode
         if json_output:
             # Convert entries to simple format
@@ -417,6 +560,18 @@ def show_database(
 
                 json_entries.append(entry_data)
 
+            metadata: dict[str, Any] = {
+                "shown_count": len(entries),
+                "has_more": has_more,
+                "limit": limit,
+                "filter": filter_expr,
+                "columns": user_columns if user_columns else list(displayed_props),
+            }
+            # The total is only known when every matching entry was read; a limited
+            # read stops early, so it reports has_more instead
+            if not has_more:
+                metadata = {"total_count": len(entries), **metadata}
+
             # Output JSON
             OutputFormatter.output_json({
                 "database": {
@@ -425,13 +580,7 @@ def show_database(
                     "url": database.get("url", ""),
                 },
                 "entries": json_entries,
-                "metadata": {
-                    "total_count": len(all_entries),
-                    "shown_count": len(entries),
-                    "limit": limit,
-                    "filter": filter_expr,
-                    "columns": user_columns if user_columns else list(displayed_props),
-                }
+                "metadata": metadata,
             })
             return
 
@@ -530,10 +679,9 @@ def show_database(
                     style="dim",
                 )
 
-        if limit is not None and len(all_entries) > limit:
-            remaining = len(all_entries) - limit
+        if has_more:
             msg = (
-                f"💡 {remaining} more entries available. Use --limit to see more "
+                "💡 More entries available. Use --limit to see more "
                 "or remove --limit to see all."
             )
             console.print(msg, style="dim")
@@ -588,7 +736,7 @@ def show_database_properties(
                 console=console
             )
 
-        client = NotionClientWrapper()
+        client = get_client()
         database = None
 
         if database_id:
@@ -684,7 +832,7 @@ def set_default_view(
         # Use the resolved view name for setting default
         resolved_view_name = view.name
 
-        config_manager = ConfigManager()
+        config_manager = get_session().config_manager
         config_manager.set_default_view(resolved_view_name)
 
         if json_output:
@@ -704,7 +852,7 @@ def get_default_view(
 ) -> None:
     """Show the current default view."""
     try:
-        config_manager = ConfigManager()
+        config_manager = get_session().config_manager
         default_view = config_manager.get_default_view()
 
         if json_output:
@@ -724,6 +872,9 @@ def show_view(
     view_name: str | None = typer.Argument(
         None, help="Name of the view to show (uses default if not specified)"
     ),
+    local: bool = typer.Option(
+        False, "--local", help="Read entries from the local mirror (see 'notion db sync')"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """Show a database using a saved view."""
@@ -752,6 +903,7 @@ def show_view(
             columns=", ".join(view.columns) if view.columns else None,
             filter_expr=view.filter_expr,
             save_view=None,  # Don't save when loading a view
+            local=local,
             json_output=json_output,
         )
 
@@ -956,7 +1108,7 @@ def create_entry(
 
     try:
         database = resolve_database_name(database_name, interactive=not json_output)
-        client = NotionClientWrapper()
+        client = get_client()
 
         if not database:
             msg = f"Database '{database_name}' not found."
@@ -971,6 +1123,16 @@ def create_entry(
             console.print(f"🤖 Generating entry for database: {database_name}")
             console.print(f"📝 Prompt: {prompt}")
 
+        # Uploads don't depend on the LLM's answer. With a single files property there
+        # is only one place to attach them, so they run while the entry is generated
+        files_properties = [
+            prop_name for prop_name, prop in properties.items() if prop.get("type") == "files"
+        ]
+        uploads = None
+        upload_failures: list[tuple[str, Exception]] = []
+        if files and len(files_properties) == 1:
+            uploads, upload_failures = start_file_uploads(client, files)
+
         # Get LLM service
         llm_service = get_default_llm_service()
         if model:
@@ -998,26 +1160,28 @@ def create_entry(
                 )
 
         # Handle file uploads if files were provided
+        file_data: dict[str, list[dict[str, Any]]] = {}
         if files:
-            # Find file properties marked with __FILE__
-            file_properties = [
-                prop_name for prop_name, value in structured_data.items() if value == "__FILE__"
-            ]
-
-            if file_properties:
-                if json_output:
-                    file_data = client.prepare_file_properties(files, file_properties)
-                else:
-                    with console.status(f"📁 Uploading {len(files)} file(s) to Notion..."):
-                        file_data = client.prepare_file_properties(files, file_properties)
-                    console.print(
-                        f"✅ Successfully uploaded {len(files)} file(s)!",
-                        style="green",
+            if uploads:
+                # The files go to the only files property even if the LLM left it out
+                file_objects = finish_file_uploads(uploads, upload_failures, json_output)
+                file_data = dict.fromkeys(files_properties, file_objects) if file_objects else {}
+            else:
+                # Find file properties marked with __FILE__
+                file_properties = [
+                    prop_name for prop_name, value in structured_data.items() if value == "__FILE__"
+                ]
+                if file_properties:
+                    file_data = upload_files(
+                        client, files, file_properties, json_output, upload_failures
                     )
 
-                # Update structured data with actual file objects
-                for prop_name, file_objects in file_data.items():
-                    structured_data[prop_name] = file_objects
+            # Update structured data with actual file objects
+            for prop_name, file_objects in file_data.items():
+                structured_data[prop_name] = file_objects
+
+            if not file_data and not json_output:
+                console.print("⚠️  The files were not attached to the entry.", style="yellow")
 
         # Convert to Notion format
         notion_properties = NotionDataConverter.convert_to_notion_properties(
@@ -1062,12 +1226,19 @@ def create_entry(
         entry_url = result.get("url", "")
 
         if json_output:
-            OutputFormatter.output_json({
+            output = {
                 "success": True,
                 "entry_id": entry_id,
                 "url": entry_url,
                 "properties": structured_data,
-            })
+            }
+            if files:
+                output["files_attached"] = bool(file_data)
+                output["upload_errors"] = [
+                    {"file": file_path, "error": str(error)}
+                    for file_path, error in upload_failures
+                ]
+            OutputFormatter.output_json(output)
         else:
             console.print("✅ Entry created successfully!", style="green")
             console.print(f"🆔 Entry ID: {entry_id}")
@@ -1078,6 +1249,90 @@ def create_entry(
         handle_error(f"Error: {e}", json_mode=json_output, console=console)
 
 
+def run_bulk_edit(
+    client: NotionClientWrapper,
+    database_id: str,
+    query_filter: CompiledFilter | None,
+    notion_updates: dict[str, Any],
+    limit: int | None,
+    checkpoint: Checkpoint,
+    json_output: bool,
+) -> None:
+    """Stream matching entries through the bulk updater and report the outcome."""
+    resumed_count = len(checkpoint.done)
+    updater = BulkUpdater(client)
+    filter_conditions = query_filter.server if query_filter else None
+    predicate = None if query_filter is None or query_filter.exact else query_filter.predicate
+
+    try:
+        if json_output:
+            results = updater.update_query(
+                database_id,
+                notion_updates,
+                filter_conditions,
+                limit,
+                checkpoint,
+                predicate=predicate,
+            )
+        else:
+            total = None if limit is None else max(limit - resumed_count, 0)
+            with Progress(
+                TextColumn("📝 Applying updates"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("updates", total=total)
+
+                def on_result(result: BulkResult) -> None:
+                    progress.advance(task)
+                    if not result.ok:
+                        progress.console.print(
+                            f"⚠️ Failed to update entry {result.key}: {result.error}",
+                            style="yellow",
+                        )
+
+                results = updater.update_query(
+                    database_id,
+                    notion_updates,
+                    filter_conditions,
+                    limit,
+                    checkpoint,
+                    on_result,
+                    predicate=predicate,
+                )
+    finally:
+        checkpoint.close()
+
+    failed = [result for result in results if not result.ok]
+    success_count = len(results) - len(failed)
+    if not failed:
+        checkpoint.remove()
+
+    if json_output:
+        OutputFormatter.output_json({
+            "success": not failed,
+            "updated_count": success_count,
+            "resumed_count": resumed_count,
+            "failed_count": len(failed),
+            "entries": [{"id": result.key} for result in results if result.ok],
+            "failed": [{"id": result.key, "error": result.error} for result in failed],
+            "checkpoint": str(checkpoint.path) if failed else None,
+        })
+    elif not results and not resumed_count:
+        console.print("❌ No entries found matching the criteria.", style="red")
+    else:
+        console.print(
+            f"✅ Successfully updated {success_count}/{len(results)} entries!",
+            style="green" if not failed else "yellow",
+        )
+        if failed:
+            console.print(
+                "Run the same command again to retry the failed entries.", style="dim"
+            )
+
+
 @db_app.command("edit")
 def edit_entries(
     prompt: str = typer.Argument(..., help="Natural language description of changes"),
@@ -1105,15 +1360,39 @@ def edit_entries(
         "-f",
         help="File paths to upload and attach to entries",
     ),
+    all_entries: bool = typer.Option(
+        False,
+        "--all",
+        help="Edit every matching entry instead of the first 10",
+    ),
+    max_entries: int | None = typer.Option(
+        None,
+        "--max",
+        min=1,
+        help="Edit at most N matching entries",
+    ),
+    restart: bool = typer.Option(
+        False,
+        "--restart",
+        help="Discard the checkpoint of an interrupted --all/--max run and start over",
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
-    """Edit database entries using natural language."""
+    """Edit database entries using natural language.
+
+    With --all or --max, matching entries are streamed and updated as they are
+    fetched, and progress is checkpointed so an interrupted run resumes where
+    it stopped when the same command is repeated.
+    """
+    if all_entries and max_entries is not None:
+        handle_error("Cannot use --all with --max", json_mode=json_output, console=console)
+
     # Get database name or use default
     database_name = get_database_name_or_default(database_name)
 
     try:
         database = resolve_database_name(database_name, interactive=not json_output)
-        client = NotionClientWrapper()
+        client = get_client()
 
         if not database:
             msg = f"Database '{database_name}' not found."
@@ -1124,6 +1403,45 @@ def edit_entries(
         database_id = database.get("id", "")
         properties = database.get("properties", {})
 
+        checkpoint = None
+        if all_entries or max_entries is not None:
+            checkpoint = Checkpoint.for_job("edit", database_id, prompt, files or [])
+            if restart:
+                checkpoint.remove()
+            elif checkpoint.plan and checkpoint.plan.get("version") != EDIT_PLAN_VERSION:
+                if not json_output:
+                    console.print(
+                        "⚠️ The interrupted edit was saved in an older format and can't be "
+                        "resumed; starting over.",
+                        style="yellow",
+                    )
+                checkpoint.remove()
+
+        if checkpoint and checkpoint.plan:
+            # Repeat the interrupted run exactly instead of asking the LLM again
+            if not json_output:
+                console.print(
+                    f"↩️ Resuming interrupted edit of {database_name}: "
+                    f"{len(checkpoint.done)} entries already updated",
+                    style="cyan",
+                )
+                if not auto_confirm and not typer.confirm("✨ Continue with the remaining entries?"):
+                    console.print("❌ Update cancelled.", style="yellow")
+                    return
+            query_filter = None
+            if checkpoint.plan["expression"]:
+                query_filter = compile_filter(checkpoint.plan["expression"], properties)
+            run_bulk_edit(
+                client,
+                database_id,
+                query_filter,
+                checkpoint.plan["updates"],
+                max_entries,
+                checkpoint,
+                json_output,
+            )
+            return
+
         if not json_output:
             console.print(f"🤖 Processing edit request for database: {database_name}")
             console.print(f"📝 Prompt: {prompt}")
@@ -1148,27 +1466,36 @@ def edit_entries(
             console.print(f"🔍 Generated filter: {filter_expression}")
 
         # Parse and apply filter
+        query_filter = None
         if filter_expression and filter_expression.lower() != "none":
             try:
-                parser = FilterParser()
-                converter = NotionFilterConverter()
-                parsed_filters = parser.parse(filter_expression)
-                filter_conditions = converter.convert(parsed_filters, properties)
+                query_filter = compile_filter(filter_expression, properties)
             except Exception as e:
                 if not json_output:
                     console.print(f"⚠️ Filter parsing failed: {e}", style="yellow")
-                filter_conditions = None
+                filter_expression = None
         else:
-            filter_conditions = None
+            filter_expression = None
 
-        # Get entries to edit
-        if json_output:
-            entries = client.get_database_entries(database_id, 10, filter_conditions)
+        def fetch_entries() -> list[dict[str, Any]]:
+            if query_filter is None or query_filter.exact:
+                return client.get_database_entries(
+                    database_id, 10, query_filter.server if query_filter else None
+                )
+            # Conditions the API can't evaluate are checked here, before the limit
+            matching = client.iter_database_entries(database_id, None, query_filter.server)
+            return list(itertools.islice(query_filter.post_filter(matching), 10))
+
+        # Get entries to edit; bulk runs stream them while updating instead
+        if checkpoint:
+            entries = None
+        elif json_output:
+            entries = fetch_entries()
         else:
             with console.status("📊 Fetching entries..."):
-                entries = client.get_database_entries(database_id, 10, filter_conditions)
+                entries = fetch_entries()
 
-        if not entries:
+        if entries is not None and not entries:
             msg = "No entries found matching the criteria."
             if json_output:
                 OutputFormatter.output_json({
@@ -1181,11 +1508,11 @@ def edit_entries(
                 console.print(f"❌ {msg}", style="red")
                 return
 
-        if not json_output:
+        if entries and not json_output:
             console.print(f"📊 Found {len(entries)} entries to potentially edit")
 
         # Show entries that will be affected (Rich mode only)
-        if not json_output:
+        if entries and not json_output:
             table = Table(title="Entries to Edit")
             table.add_column("Index", style="cyan")
             table.add_column("ID", style="dim")
@@ -1256,15 +1583,7 @@ def edit_entries(
             ]
 
             if file_properties:
-                if json_output:
-                    file_data = client.prepare_file_properties(files, file_properties)
-                else:
-                    with console.status(f"📁 Uploading {len(files)} file(s) to Notion..."):
-                        file_data = client.prepare_file_properties(files, file_properties)
-                    console.print(
-                        f"✅ Successfully uploaded {len(files)} file(s)!",
-                        style="green",
-                    )
+                file_data = upload_files(client, files, file_properties, json_output)
 
                 # Update structured data with actual file objects
                 for prop_name, file_objects in file_data.items():
@@ -1272,10 +1591,13 @@ def edit_entries(
 
         # Confirm updates (skip in JSON mode or with auto_confirm)
         if not json_output and not auto_confirm:
-            console.print(
-                f"\n⚠️ This will update {len(entries)} entries",
-                style="yellow",
-            )
+            if entries is not None:
+                scope = f"{len(entries)} entries"
+            elif max_entries is not None:
+                scope = f"up to {max_entries} matching entries"
+            else:
+                scope = "all matching entries"
+            console.print(f"\n⚠️ This will update {scope}", style="yellow")
             confirm = typer.confirm("✨ Proceed with updates?")
             if not confirm:
                 console.print("❌ Update cancelled.", style="yellow")
@@ -1287,47 +1609,363 @@ def edit_entries(
             properties,
         )
 
+        if checkpoint:
+            checkpoint.start(
+                {
+                    "version": EDIT_PLAN_VERSION,
+                    "expression": filter_expression,
+                    "updates": notion_updates,
+                }
+            )
+            run_bulk_edit(
+                client,
+                database_id,
+                query_filter,
+                notion_updates,
+                max_entries,
+                checkpoint,
+                json_output,
+            )
+            return
+
         # Apply updates
-        success_count = 0
-        updated_entries = []
+        updater = BulkUpdater(client)
+        page_ids = [entry["id"] for entry in entries]
 
         if json_output:
-            for entry in entries:
-                try:
-                    client.update_page(entry["id"], notion_updates)
-                    success_count += 1
-                    # Extract simple properties for JSON output
-                    entry_props = OutputFormatter._extract_simple_properties(
-                        entry.get("properties", {})
-                    )
-                    updated_entries.append({
-                        "id": entry["id"],
-                        "properties": entry_props
-                    })
-                except Exception as e:
-                    # In JSON mode, still try to update other entries
-                    pass
+            results = updater.update_pages(page_ids, notion_updates)
         else:
-            with console.status("📝 Applying updates..."):
-                for entry in entries:
-                    try:
-                        client.update_page(entry["id"], notion_updates)
-                        success_count += 1
-                    except Exception as e:
-                        console.print(
-                            f"⚠️ Failed to update entry {entry['id']}: {e}",
+            with Progress(
+                TextColumn("📝 Applying updates"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("updates", total=len(page_ids))
+
+                def on_result(result: BulkResult) -> None:
+                    progress.advance(task)
+                    if not result.ok:
+                        progress.console.print(
+                            f"⚠️ Failed to update entry {result.key}: {result.error}",
                             style="yellow",
                         )
 
+                results = updater.update_pages(page_ids, notion_updates, on_result)
+
+        failed = [result for result in results if not result.ok]
+        success_count = len(results) - len(failed)
+
         if json_output:
             OutputFormatter.output_json({
-                "success": True,
+                "success": not failed,
                 "updated_count": success_count,
-                "entries": updated_entries
+                "failed_count": len(failed),
+                "entries": [
+                    {
+                        "id": result.key,
+                        "properties": OutputFormatter._extract_simple_properties(
+                            (result.result or {}).get("properties", {})
+                        ),
+                    }
+                    for result in results
+                    if result.ok
+                ],
+                "failed": [{"id": result.key, "error": result.error} for result in failed],
             })
         else:
             console.print(
                 f"✅ Successfully updated {success_count}/{len(entries)} entries!",
+                style="green" if not failed else "yellow",
+            )
+
+    except Exception as e:
+        handle_error(f"Error: {e}", json_mode=json_output, console=console)
+
+
+@db_app.command("import")
+def import_entries(
+    file_path: str = typer.Argument(..., help="CSV or JSON Lines file with one entry per row"),
+    database_name: str | None = typer.Option(
+        None,
+        "--database",
+        "-d",
+        help="Database to import into (uses default if not specified)",
+    ),
+    file_format: str | None = typer.Option(
+        None,
+        "--format",
+        help="Input format: csv or jsonl (default: from the file extension)",
+    ),
+    rejects: str | None = typer.Option(
+        None,
+        "--rejects",
+        help="File for rows that fail to import (default: NAME.rejects.EXT next to the input)",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    """Create database entries from a CSV or JSON Lines file, without the LLM.
+
+    Columns are matched to properties by name. Rows that fail are written to a
+    rejects file with the reason, so it can be fixed and imported again.
+    """
+    file_format = (file_format or detect_format(file_path)).lower()
+    if file_format not in IMPORT_FORMATS:
+        handle_error(
+            f"Unsupported format '{file_format}'. Use one of: {', '.join(IMPORT_FORMATS)}",
+            json_mode=json_output,
+            console=console,
+        )
+    if not os.path.isfile(file_path):
+        handle_error(f"File not found: {file_path}", json_mode=json_output, console=console)
+
+    # Get database name or use default
+    database_name = get_database_name_or_default(database_name)
+
+    try:
+        database = resolve_database_name(database_name, interactive=not json_output)
+        client = get_client()
+
+        if not database:
+            msg = f"Database '{database_name}' not found."
+            if not json_output:
+                console.print("Use 'notion db list' to see available databases.", style="yellow")
+            handle_error(msg, json_mode=json_output, console=console)
+
+        rejects_path = Path(rejects) if rejects else default_rejects_path(file_path)
+        importer = EntryImporter(client, database, file_format, rejects_path)
+
+        if json_output:
+            importer.run(file_path)
+        else:
+            with Progress(
+                TextColumn("📥 Importing {task.fields[name]}"),
+                TextColumn("{task.completed} rows"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("import", total=None, name=os.path.basename(file_path))
+                importer.run(file_path, lambda result: progress.advance(task))
+
+        rejected_count = importer.rejects.count
+        if json_output:
+            OutputFormatter.output_json({
+                "success": rejected_count == 0,
+                "created_count": importer.created_count,
+                "rejected_count": rejected_count,
+                "rejects_file": str(rejects_path) if rejected_count else None,
+                "ignored_columns": importer.ignored_columns,
+                "skipped_columns": importer.skipped_columns,
+            })
+        else:
+            if importer.ignored_columns:
+                console.print(
+                    "⚠️ Ignored columns with no matching property: "
+                    + ", ".join(importer.ignored_columns),
+                    style="yellow",
+                )
+            if importer.skipped_columns:
+                console.print(
+                    "⚠️ Skipped columns whose property can't be set on import: "
+                    + ", ".join(importer.skipped_columns),
+                    style="yellow",
+                )
+            console.print(
+                f"✅ Imported {importer.created_count} entries into {database_name}",
+                style="green",
+            )
+            if rejected_count:
+                console.print(
+                    f"⚠️ {rejected_count} rows failed; see {rejects_path}",
+                    style="yellow",
+                )
+
+    except Exception as e:
+        handle_error(f"Error: {e}", json_mode=json_output, console=console)
+
+
+@db_app.command("export")
+def export_entries(
+    output: str = typer.Argument(..., help="File to write, or - for standard output"),
+    database_name: str | None = typer.Option(
+        None,
+        "--database",
+        "-d",
+        help="Database to export (uses default if not specified)",
+    ),
+    file_format: str | None = typer.Option(
+        None,
+        "--format",
+        help="Output format: jsonl, csv or parquet (default: from the file extension)",
+    ),
+    columns: str | None = typer.Option(
+        None,
+        "--columns",
+        "-c",
+        help="Comma-separated list of properties to export (default: all)",
+    ),
+    filter_expr: str | None = typer.Option(
+        None,
+        "--filter",
+        "-f",
+        help="Filter expression (e.g., 'status=Done', 'tags in urgent')",
+    ),
+    limit: int | None = typer.Option(
+        None,
+        "--limit",
+        "-l",
+        help="Maximum number of entries to export",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    """Export database entries to a JSON Lines, CSV or Parquet file.
+
+    Entries are written as each page of results arrives instead of being
+    collected first, so exports of any size run in constant memory.
+    """
+    to_stdout = output == "-"
+    file_format = (file_format or detect_export_format(output)).lower()
+    if file_format not in EXPORT_FORMATS:
+        handle_error(
+            f"Unsupported format '{file_format}'. Use one of: {', '.join(EXPORT_FORMATS)}",
+            json_mode=json_output,
+            console=console,
+        )
+    if to_stdout and file_format == "parquet":
+        handle_error(
+            "Parquet can only be exported to a file", json_mode=json_output, console=console
+        )
+    # Exported rows own standard output, so progress and summaries are left out
+    quiet = json_output or to_stdout
+
+    # Get database name or use default
+    database_name = get_database_name_or_default(database_name)
+
+    try:
+        database = resolve_database_name(database_name, interactive=not quiet)
+        client = get_client()
+
+        if not database:
+            msg = f"Database '{database_name}' not found."
+            if not quiet:
+                console.print("Use 'notion db list' to see available databases.", style="yellow")
+            handle_error(msg, json_mode=quiet, console=console)
+
+        query_filter = None
+        if filter_expr:
+            try:
+                query_filter = compile_filter(filter_expr, database.get("properties", {}))
+            except Exception as e:
+                handle_error(f"Filter error: {e}", json_mode=quiet, console=console)
+
+        user_columns = [col.strip() for col in columns.split(",")] if columns else None
+        exporter = EntryExporter(client, database, file_format, user_columns)
+        destination = sys.stdout if to_stdout else Path(output)
+
+        if quiet:
+            exporter.run(destination, query_filter, limit)
+        else:
+            with Progress(
+                TextColumn("📤 Exporting {task.fields[name]}"),
+                TextColumn("{task.completed} rows"),
+                TextColumn("{task.fields[rate]:.0f} rows/s"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("export", total=None, name=database_name, rate=0.0)
+                exporter.run(
+                    destination,
+                    query_filter,
+                    limit,
+                    lambda rows: progress.update(
+                        task, completed=rows, rate=exporter.rows_per_second
+                    ),
+                )
+
+        if json_output and not to_stdout:
+            OutputFormatter.output_json({
+                "success": True,
+                "output": output,
+                "format": file_format,
+                "rows": exporter.row_count,
+                "seconds": round(exporter.elapsed, 3),
+                "rows_per_second": round(exporter.rows_per_second, 1),
+            })
+        elif not quiet:
+            console.print(
+                f"✅ Exported {exporter.row_count} entries to {output} "
+                f"({exporter.rows_per_second:.0f} rows/s)",
+                style="green",
+            )
+
+    except Exception as e:
+        handle_error(f"Error: {e}", json_mode=quiet, console=console)
+
+
+@db_app.command("sync")
+def sync_database(
+    name: str | None = typer.Argument(
+        None, help="Database to mirror locally (uses default if not specified)"
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Rescan every entry, dropping entries deleted in Notion from the mirror",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+) -> None:
+    """Sync a local mirror of a database for use with --local.
+
+    The first sync downloads every entry; later syncs only fetch the entries
+    edited since the previous one.
+    """
+    # Get database name or use default
+    name = get_database_name_or_default(name)
+
+    try:
+        database = resolve_database_name(name, interactive=not json_output)
+        client = get_client()
+
+        if not database:
+            msg = f"Database '{name}' not found."
+            if not json_output:
+                console.print("Use 'notion db list' to see available databases.", style="yellow")
+            handle_error(msg, json_mode=json_output, console=console)
+
+        database_id = database.get("id", "")
+        incremental = not full and client.mirror.high_water_mark(database_id) is not None
+
+        if json_output:
+            fetched = client.sync_mirror(database, full=full)
+        else:
+            with Progress(
+                TextColumn(f"🔄 {'Updating' if incremental else 'Mirroring'} {name}"),
+                TextColumn("{task.completed} entries"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("sync", total=None)
+                fetched = client.sync_mirror(
+                    database,
+                    full=full,
+                    on_progress=lambda count: progress.update(task, completed=count),
+                )
+
+        status = client.mirror.status(database_id)
+        if json_output:
+            OutputFormatter.output_json({
+                "success": True,
+                "database_id": database_id,
+                "incremental": incremental,
+                "fetched_count": fetched,
+                "entry_count": status["entry_count"],
+                "high_water_mark": status["high_water_mark"],
+            })
+        else:
+            console.print(
+                f"✅ Mirrored {status['entry_count']} entries of {name} "
+                f"({fetched} fetched)",
                 style="green",
             )
 
@@ -1424,6 +2062,9 @@ def get_entry_link(
         "-l",
         help="Maximum number of results to show",
     ),
+    local: bool = typer.Option(
+        False, "--local", help="Search the local mirror (see 'notion db sync')"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ) -> None:
     """Get the link for a specific database entry."""
@@ -1431,19 +2072,29 @@ def get_entry_link(
     database_name = get_database_name_or_default(database_name)
 
     try:
-        database = resolve_database_name(database_name, interactive=not json_output)
+        if local:
+            database = resolve_local_database(database_name, json_output)
+        else:
+            database = resolve_database_name(database_name, interactive=not json_output)
         if not database:
             msg = f"Database '{database_name}' not found."
             if not json_output:
                 console.print("Use 'notion db list' to see available databases.", style="yellow")
             handle_error(msg, json_mode=json_output, console=console)
 
-        client = NotionClientWrapper()
-        entries = client.get_database_entry_by_name(
-            database_name,
-            entry_name,
-            fuzzy=not exact,
-        )
+        client = get_client()
+        if local:
+            entries = client.get_mirrored_entry_by_name(
+                database.get("id", ""),
+                entry_name,
+                fuzzy=not exact,
+            )
+        else:
+            entries = client.get_database_entry_by_name(
+                database_name,
+                entry_name,
+                fuzzy=not exact,
+            )
 
         if not entries:
             msg = f"No entries found matching '{entry_name}' in database '{database_name}'."
@@ -1573,7 +2224,7 @@ def list_pages(
 ) -> None:
     """List all accessible pages."""
     try:
-        client = NotionClientWrapper()
+        client = get_client()
         pages = client.search_pages()
 
         if not pages:
@@ -1620,7 +2271,7 @@ def find_page(
 ) -> None:
     """Find pages by name and show their links."""
     try:
-        client = NotionClientWrapper()
+        client = get_client()
         pages = client.get_page_by_name(name, fuzzy=not exact)
 
         if not pages:
@@ -1759,7 +2410,7 @@ def create_page(
                 console=console
             )
 
-        client = NotionClientWrapper()
+        client = get_client()
 
         # Determine the parent (page or database)
         parent_id = None
@@ -2011,7 +2662,7 @@ def get_page_link(
 ) -> None:
     """Get the link for a specific page."""
     try:
-        client = NotionClientWrapper()
+        client = get_client()
         pages = client.get_page_by_name(name, fuzzy=True)
 
         if not pages:
@@ -2132,7 +2783,7 @@ def update_page(
                 console=console
             )
 
-        client = NotionClientWrapper()
+        client = get_client()
         page = None
         page_id_to_update = page_id
 
@@ -2344,7 +2995,7 @@ def view_page(
                 console=console
             )
 
-        client = NotionClientWrapper()
+        client = get_client()
         page = None
 
         if page_id:
@@ -2396,13 +3047,14 @@ def view_page(
         if not page:
             handle_error("Failed to retrieve page", json_mode=json_output, console=console)
 
-        # Get page blocks
+        # Get page blocks (reused from the cache if the page hasn't changed)
         page_id_to_fetch = page.get("id", "")
+        last_edited_time = page.get("last_edited_time")
         if json_output:
-            blocks = client.get_page_blocks(page_id_to_fetch)
+            blocks = client.get_page_blocks(page_id_to_fetch, last_edited_time)
         else:
             with console.status("Fetching page content..."):
-                blocks = client.get_page_blocks(page_id_to_fetch)
+                blocks = client.get_page_blocks(page_id_to_fetch, last_edited_time)
 
         # Format and display
         output = OutputFormatter.format_page_content(page, blocks, as_json=json_output)
@@ -2445,7 +3097,7 @@ _notion_completion() {
             opts="setup test"
             ;;
         db)
-            opts="list show properties create edit link entry-link"
+            opts="list show properties create edit import export sync link entry-link"
             ;;
         view)
             opts="list show update delete"
@@ -2502,6 +3154,9 @@ _notion() {
                         "properties[Show property schema]" \\
                         "create[Create new entry]" \\
                         "edit[Edit entries]" \\
+                        "import[Import entries from CSV/JSONL]" \\
+                        "export[Export entries to JSONL/CSV/Parquet]" \\
+                        "sync[Sync local mirror]" \\
                         "link[Get database link]" \\
                         "entry-link[Get entry link]"
                     ;;
@@ -2556,6 +3211,9 @@ complete -c notion -f -n "__fish_seen_subcommand_from db" -a "show" -d "Show dat
 complete -c notion -f -n "__fish_seen_subcommand_from db" -a "properties" -d "Show property schema"
 complete -c notion -f -n "__fish_seen_subcommand_from db" -a "create" -d "Create new entry"
 complete -c notion -f -n "__fish_seen_subcommand_from db" -a "edit" -d "Edit entries"
+complete -c notion -f -n "__fish_seen_subcommand_from db" -a "import" -d "Import entries from CSV/JSONL"
+complete -c notion -f -n "__fish_seen_subcommand_from db" -a "export" -d "Export entries to JSONL/CSV/Parquet"
+complete -c notion -f -n "__fish_seen_subcommand_from db" -a "sync" -d "Sync local mirror"
 complete -c notion -f -n "__fish_seen_subcommand_from db" -a "link" -d "Get database link"
 complete -c notion -f -n "__fish_seen_subcommand_from db" -a "entry-link" -d "Get entry link"
 
@@ -2591,7 +3249,7 @@ Register-ArgumentCompleter -CommandName notion -ScriptBlock {
 
     $commands = @{
         'auth' = @('setup', 'test')
-        'db' = @('list', 'show', 'properties', 'create', 'edit', 'link', 'entry-link')
+        'db' = @('list', 'show', 'properties', 'create', 'edit', 'import', 'export', 'sync', 'link', 'entry-link')
         'view' = @('list', 'show', 'update', 'delete')
         'page' = @('list', 'find', 'link', 'view', 'create', 'update')
         'completion' = @('install', 'show', 'uninstall')
@@ -0,0 +1,241 @@
+"""Local SQLite mirror of database entries."""
+
+import json
+import sqlite3
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from platformdirs import user_cache_dir
+
+from .cache import _SQLiteCache
+from .index import SIMILARITY_THRESHOLD, similarity
+
+
+class DatabaseMirror(_SQLiteCache):
+    """Local copy of the entries of synced databases.
+
+    Each database remembers the newest last_edited_time among its mirrored
+    entries, so a sync only has to fetch what was edited since. Unlike the
+    caches, the mirror raises its errors: a mirror that silently stopped
+    updating would serve stale entries as if they were current.
+    """
+
+    schema = """
+        CREATE TABLE IF NOT EXISTS databases (
+            database_id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            high_water_mark TEXT,
+            synced_at REAL,
+            data BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS entries (
+            database_id TEXT NOT NULL,
+            page_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            last_edited_time TEXT NOT NULL,
+            synced_at REAL NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (database_id, page_id)
+        );
+        CREATE INDEX IF NOT EXISTS entries_by_time ON entries (database_id, last_edited_time);
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the mirror, defaulting to the user cache directory."""
+        super().__init__(path or Path(user_cache_dir("notion", "notion")) / "mirror.db")
+
+    def high_water_mark(self, database_id: str) -> str | None:
+        """Return the newest last_edited_time mirrored for a database, if it was synced."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT high_water_mark FROM databases WHERE database_id = ?", (database_id,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+        return row[0] if row else None
+
+    def begin(self, database: dict[str, Any], title: str) -> None:
+        """Store the database object a sync is about to mirror the entries of."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO databases (database_id, title, data) VALUES (?, ?, ?)"
+                    " ON CONFLICT (database_id) DO UPDATE"
+                    " SET title = excluded.title, data = excluded.data",
+                    (
+                        database.get("id", ""),
+                        title,
+                        zlib.compress(json.dumps(database).encode()),
+                    ),
+                )
+        except (sqlite3.Error, OSError) as e:
+            raise Exception(f"Failed to update local mirror: {e}")
+
+    def store(self, database_id: str, items: list[tuple[str, dict[str, Any]]]) -> None:
+        """Store ``(title, entry)`` pairs and advance the database's high-water mark.
+
+        Archived entries are removed instead of stored.
+        """
+        now = time.time()
+        times = [entry.get("last_edited_time", "") for _, entry in items]
+        try:
+            with self._connect() as conn:
+                for title, entry in items:
+                    page_id = entry.get("id", "")
+                    if entry.get("archived") or entry.get("in_trash"):
+                        conn.execute(
+                            "DELETE FROM entries WHERE database_id = ? AND page_id = ?",
+                            (database_id, page_id),
+                        )
+                        continue
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            database_id,
+                            page_id,
+                            title,
+                            entry.get("last_edited_time", ""),
+                            now,
+                            zlib.compress(json.dumps(entry).encode()),
+                        ),
+                    )
+
+                if any(times):
+                    conn.execute(
+                        "UPDATE databases"
+                        " SET high_water_mark = max(coalesce(high_water_mark, ''), ?)"
+                        " WHERE database_id = ?",
+                        (max(times), database_id),
+                    )
+        except (sqlite3.Error, OSError) as e:
+            raise Exception(f"Failed to update local mirror: {e}")
+
+    def finish(self, database_id: str, full_since: float | None = None) -> None:
+        """Mark a sync as complete.
+
+        Args:
+            database_id: ID of the synced database
+            full_since: Start time of a full sync; entries it didn't see were
+                deleted in Notion and are dropped
+        """
+        try:
+            with self._connect() as conn:
+                if full_since is not None:
+                    conn.execute(
+                        "DELETE FROM entries WHERE database_id = ? AND synced_at < ?",
+                        (database_id, full_since),
+                    )
+                conn.execute(
+                    "UPDATE databases SET synced_at = ? WHERE database_id = ?",
+                    (time.time(), database_id),
+                )
+        except (sqlite3.Error, OSError) as e:
+            raise Exception(f"Failed to update local mirror: {e}")
+
+    def database(self, database_id: str) -> dict[str, Any] | None:
+        """Return the mirrored database object, or None if it was never synced."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT data FROM databases WHERE database_id = ? AND synced_at IS NOT NULL",
+                    (database_id,),
+                ).fetchone()
+            return json.loads(zlib.decompress(row[0])) if row else None
+        except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+
+    def find_databases(self, name: str) -> list[tuple[str, dict[str, Any]]]:
+        """Return the synced databases whose title equals ``name``, else those it prefixes.
+
+        Titles are compared case-insensitively.
+        """
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT title, data FROM databases WHERE synced_at IS NOT NULL ORDER BY title"
+                ).fetchall()
+            name_lower = name.lower()
+            matches = [
+                (title, json.loads(zlib.decompress(data)))
+                for title, data in rows
+                if title.lower().startswith(name_lower)
+            ]
+        except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+
+        exact = [match for match in matches if match[0].lower() == name_lower]
+        return exact or matches
+
+    def status(self, database_id: str) -> dict[str, Any]:
+        """Return the entry count, high-water mark and last sync time of a database."""
+        try:
+            with self._connect() as conn:
+                count = conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE database_id = ?", (database_id,)
+                ).fetchone()[0]
+                row = conn.execute(
+                    "SELECT high_water_mark, synced_at FROM databases WHERE database_id = ?",
+                    (database_id,),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+
+        high_water_mark, synced_at = row or (None, None)
+        return {"entry_count": count, "high_water_mark": high_water_mark, "synced_at": synced_at}
+
+    def iter_entries(self, database_id: str) -> Iterator[dict[str, Any]]:
+        """Yield the mirrored entries of a database, most recently edited first."""
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(
+                    "SELECT data FROM entries WHERE database_id = ?"
+                    " ORDER BY last_edited_time DESC, page_id",
+                    (database_id,),
+                )
+                while rows := cursor.fetchmany(500):
+                    for (data,) in rows:
+                        yield json.loads(zlib.decompress(data))
+        except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+
+    def search(
+        self,
+        database_id: str,
+        query: str,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> list[tuple[float, str, dict[str, Any]]]:
+        """Find mirrored entries with titles similar to a query.
+
+        Scored like ``TitleIndex.search``: the Dice coefficient of the trigram
+        sets, with titles containing the query verbatim always included.
+
+        Returns:
+            ``(similarity, title, entry)`` tuples, most similar first
+        """
+        query_lower = query.lower()
+        try:
+            with self._connect() as conn:
+                scored = []
+                for page_id, title in conn.execute(
+                    "SELECT page_id, title FROM entries WHERE database_id = ?", (database_id,)
+                ):
+                    score = similarity(query, title)
+                    if score >= threshold or query_lower in title.lower():
+                        scored.append((score, title, page_id))
+
+                results = []
+                for score, title, page_id in scored:
+                    (data,) = conn.execute(
+                        "SELECT data FROM entries WHERE database_id = ? AND page_id = ?",
+                        (database_id, page_id),
+                    ).fetchone()
+                    results.append((score, title, json.loads(zlib.decompress(data))))
+        except (sqlite3.Error, OSError, ValueError, zlib.error) as e:
+            raise Exception(f"Failed to read local mirror: {e}")
+
+        results.sort(key=lambda result: result[0], reverse=True)
+        return results
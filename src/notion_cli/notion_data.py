@@ -1,7 +1,63 @@
 """Utilities for converting data to Notion API format."""
 
+from datetime import datetime
 from typing import Any
 
+# Property types the API computes itself and refuses in writes
+READ_ONLY_PROPERTY_TYPES = (
+    "formula",
+    "rollup",
+    "created_time",
+    "created_by",
+    "last_edited_time",
+    "last_edited_by",
+    "unique_id",
+    "verification",
+    "button",
+)
+
+# Separates multi-select names (and relation or people IDs) in a single text cell
+LIST_SEPARATOR = ", "
+
+
+def format_list_cell(values: list[str]) -> str:
+    """Join a list of names into one cell, as ``parse_list_cell`` reads it back."""
+    return LIST_SEPARATOR.join(values)
+
+
+def parse_list_cell(cell: str) -> list[str]:
+    """Split a comma-separated cell into its names."""
+    return [value.strip() for value in cell.split(",") if value.strip()]
+
+
+def format_date_cell(date: dict[str, Any]) -> str:
+    """Write a ``{"start", "end"}`` date as ``start``, or ``start/end`` for a range."""
+    return date["start"] if not date.get("end") else f"{date['start']}/{date['end']}"
+
+
+def _is_iso_date(value: Any) -> bool:
+    """Whether a value is an ISO 8601 date or date-time, as the API expects."""
+    try:
+        datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+def parse_date_cell(value: Any) -> dict[str, Any]:
+    """Read a date written by ``format_date_cell``, or a ``{"start", "end"}`` object.
+
+    Raises:
+        ValueError: If the start or end is not an ISO 8601 date
+    """
+    if isinstance(value, dict):
+        start, end = value.get("start"), value.get("end")
+    else:
+        start, _, end = str(value).strip().partition("/")
+    if not start or not _is_iso_date(start) or (end and not _is_iso_date(end)):
+        raise ValueError(f"{value!r} is not an ISO 8601 date or start/end range")
+    return {"start": str(start).strip(), "end": str(end).strip() if end else None}
+
 
 class NotionDataConverter:
     """Converts structured data to Notion API format."""
@@ -44,14 +100,20 @@ class NotionDataConverter:
                     }
                 else:
                     # Handle comma-separated string
-                    values = [v.strip() for v in str(value).split(",")]
                     notion_properties[field_name] = {
-                        "multi_select": [{"name": v} for v in values],
+                        "multi_select": [{"name": v} for v in parse_list_cell(str(value))],
                     }
             elif prop_type == "date":
-                # Expect ISO date format
-                notion_properties[field_name] = {"date": {"start": str(value)}}
+                if isinstance(value, dict):
+                    # Already a {"start", "end"} date, e.g. a range from parse_date_cell
+                    notion_properties[field_name] = {"date": value}
+                else:
+                    # Expect ISO date format
+                    notion_properties[field_name] = {"date": {"start": str(value)}}
             elif prop_type == "checkbox":
+                if isinstance(value, str):
+                    # Text such as "false" or "yes", e.g. from an imported file
+                    value = value.strip().lower() in ("true", "yes", "y", "1", "x", "checked")
                 notion_properties[field_name] = {"checkbox": bool(value)}
             elif prop_type == "url":
                 notion_properties[field_name] = {"url": str(value)}
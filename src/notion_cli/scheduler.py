@@ -0,0 +1,235 @@
+"""Request scheduling for the Notion API: rate limiting and retries."""
+
+import copy
+import random
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+from .config import NotionConfig
+
+T = TypeVar("T")
+
+# HTTP statuses that are worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that spaces out requests to a sustained rate."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket with a refill rate (tokens/s) and a capacity."""
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it.
+
+        Tokens may go negative, which queues callers fairly behind each other
+        without holding the lock while they sleep.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = 0.0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for the given number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            # Drain the bucket so callers don't burst as soon as the pause ends
+            self._tokens = min(self._tokens, 0.0)
+
+
+class _Flight:
+    """A call in flight and the number of callers waiting for it."""
+
+    def __init__(self) -> None:
+        self.future: Future[Any] = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls so that only one of them runs.
+
+    Callers that arrive while a call with the same key is in flight wait for
+    it and receive a copy of its result (or its exception) instead of
+    repeating the work.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def call(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func``, or join the in-flight call with the same key."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            # Results are mutable dicts, so each waiter gets its own copy
+            return copy.deepcopy(flight.future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                del self._flights[key]
+            flight.future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._flights[key]
+            shared = flight.waiters > 0
+        # Waiters copy from a snapshot, since the leader's caller may mutate its result
+        flight.future.set_result(copy.deepcopy(result) if shared else result)
+        return result
+
+
+class RequestScheduler:
+    """Central scheduler for outgoing API calls.
+
+    Every call takes a token from a shared bucket before it is sent. Calls that
+    fail with a rate limit or server error are retried, honoring the server's
+    ``Retry-After`` header or falling back to jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 3.0,
+        burst: int = 3,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.bucket = TokenBucket(requests_per_second, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: NotionConfig) -> "RequestScheduler":
+        """Create a scheduler from the CLI configuration."""
+        return cls(
+            requests_per_second=config.requests_per_second,
+            burst=config.request_burst,
+            max_retries=config.max_retries,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+        )
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        retry_server_errors: bool = True,
+        **kwargs: Any,
+    ) -> T:
+        """Call ``func`` under the rate limit, retrying on 429 and 5xx responses.
+
+        Args:
+            func: The function performing a single request
+            retry_server_errors: Whether 5xx responses may be retried. Pass False
+                for non-idempotent requests, which are then only retried on 429.
+        """
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self.retry_delay(e, attempt, retry_server_errors)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+
+    def retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        retry_server_errors: bool = True,
+    ) -> float | None:
+        """Return how long to wait before retrying a failed call, or None to give up."""
+        status = _error_status(error)
+        if status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+            return None
+        if status != 429 and not retry_server_errors:
+            return None
+
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            delay = min(retry_after, self.max_delay)
+        else:
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+        if status == 429:
+            # The limit is shared by the whole integration, so slow everyone down
+            self.bucket.pause(delay)
+        return delay
+
+
+def _error_status(error: Exception) -> int | None:
+    """Extract the HTTP status from a notion_client, httpx or requests error."""
+    status = getattr(error, "status", None)
+    if isinstance(status, int):
+        return status
+
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Parse the Retry-After header (delta-seconds or HTTP date) of a failed response."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(retry_at.timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,49 @@
+"""Per-process session sharing one configuration and API client."""
+
+import atexit
+
+from .client import NotionClientWrapper
+from .config import ConfigManager
+
+
+class Session:
+    """Configuration and Notion client shared by everything a command does.
+
+    Building the client is deferred until it is first needed, so commands that
+    only touch the configuration never require a token.
+    """
+
+    def __init__(self, config_manager: ConfigManager | None = None) -> None:
+        """Initialize the session."""
+        self.config_manager = config_manager or ConfigManager()
+        self._client: NotionClientWrapper | None = None
+
+    @property
+    def client(self) -> NotionClientWrapper:
+        """Return the session's client, creating it on first use."""
+        if self._client is None:
+            self._client = NotionClientWrapper(self.config_manager)
+        return self._client
+
+    def close(self) -> None:
+        """Close the client's pooled connections, if it was created."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+_session: Session | None = None
+
+
+def get_session() -> Session:
+    """Return the session of the current process."""
+    global _session
+    if _session is None:
+        _session = Session()
+        atexit.register(_session.close)
+    return _session
+
+
+def get_client() -> NotionClientWrapper:
+    """Return the Notion client of the current process."""
+    return get_session().client
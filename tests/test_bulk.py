@@ -0,0 +1,144 @@
+"""Tests for resumable bulk updates."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from notion_client.errors import APIResponseError
+
+from notion_cli.bulk import BulkUpdater, Checkpoint
+
+
+def api_error(status: int, code: str) -> APIResponseError:
+    response = httpx.Response(status, request=httpx.Request("POST", "https://api.notion.com"))
+    return APIResponseError(response=response, message=code, code=code)
+
+
+class FakeClient:
+    """Serves a database as fixed pages of entries, keyed by the cursor that starts them."""
+
+    def __init__(self, pages: list[list[str]]) -> None:
+        self.config = SimpleNamespace(max_concurrency=1)
+        self.pages = pages
+        self.start_cursors: list[str | None] = []
+        self.updated: list[str] = []
+        self.cursor_error: APIResponseError | None = None
+
+    def iter_database_pages(
+        self,
+        database_id: str,
+        filter_conditions: dict[str, Any] | None = None,
+        start_cursor: str | None = None,
+    ):
+        self.start_cursors.append(start_cursor)
+        if start_cursor and self.cursor_error:
+            # Wrapped the way NotionClientWrapper.query_database wraps API errors
+            raise Exception("Failed to query database") from self.cursor_error
+        first = int(start_cursor[1:]) if start_cursor else 0
+        for number in range(first, len(self.pages)):
+            has_more = number + 1 < len(self.pages)
+            yield {
+                "results": [{"id": page_id} for page_id in self.pages[number]],
+                "has_more": has_more,
+                "next_cursor": f"c{number + 1}" if has_more else None,
+            }
+
+    def update_page(self, page_id: str, properties: dict[str, Any]) -> dict[str, Any]:
+        self.updated.append(page_id)
+        return {"id": page_id}
+
+
+def test_checkpoint_replays_plan_done_and_cursor(tmp_path):
+    path = tmp_path / "job.jsonl"
+    checkpoint = Checkpoint(path)
+    checkpoint.start({"expression": "Status=Todo"})
+    checkpoint.record_done("p1")
+    checkpoint.record_done("p2")
+    checkpoint.record_cursor("c1")
+    checkpoint.record_cursor("c2")
+    checkpoint.close()
+
+    resumed = Checkpoint(path)
+    assert resumed.plan == {"expression": "Status=Todo"}
+    assert resumed.done == {"p1", "p2"}
+    assert resumed.cursor == "c2"
+
+
+def test_checkpoint_skips_line_cut_short(tmp_path):
+    path = tmp_path / "job.jsonl"
+    checkpoint = Checkpoint(path)
+    checkpoint.start({})
+    checkpoint.record_done("p1")
+    checkpoint.close()
+    with open(path, "a") as f:
+        f.write('{"done": "p')
+
+    assert Checkpoint(path).done == {"p1"}
+
+
+def test_checkpoint_start_and_remove_discard_progress(tmp_path):
+    path = tmp_path / "job.jsonl"
+    checkpoint = Checkpoint(path)
+    checkpoint.start({"run": 1})
+    checkpoint.record_done("p1")
+    checkpoint.record_cursor("c1")
+    checkpoint.start({"run": 2})
+    checkpoint.close()
+
+    restarted = Checkpoint(path)
+    assert (restarted.plan, restarted.done, restarted.cursor) == ({"run": 2}, set(), None)
+
+    restarted.remove()
+    assert not path.exists()
+    assert Checkpoint(path).plan is None
+
+
+def test_update_query_resumes_after_cursor_and_done(tmp_path):
+    path = tmp_path / "job.jsonl"
+    client = FakeClient([["p1", "p2"], ["p3", "p4"]])
+    checkpoint = Checkpoint(path)
+    checkpoint.start({})
+    BulkUpdater(client).update_query("db", {}, limit=3, checkpoint=checkpoint)
+    checkpoint.close()
+    assert client.updated == ["p1", "p2", "p3"]
+
+    resumed = Checkpoint(path)
+    assert resumed.done == {"p1", "p2", "p3"}
+    assert resumed.cursor == "c1"
+
+    client.updated.clear()
+    results = BulkUpdater(client).update_query("db", {}, checkpoint=resumed)
+    resumed.close()
+    assert client.start_cursors[-1] == "c1"
+    assert client.updated == ["p4"]
+    assert [result.key for result in results] == ["p4"]
+
+
+def test_rejected_cursor_restarts_the_query(tmp_path):
+    client = FakeClient([["p1"], ["p2"]])
+    client.cursor_error = api_error(400, "validation_error")
+    checkpoint = Checkpoint(tmp_path / "job.jsonl")
+    checkpoint.start({})
+    checkpoint.record_done("p1")
+    checkpoint.record_cursor("c1")
+
+    BulkUpdater(client).update_query("db", {}, checkpoint=checkpoint)
+    checkpoint.close()
+    assert client.start_cursors == ["c1", None]
+    assert client.updated == ["p2"]
+
+
+def test_other_query_errors_keep_the_cursor(tmp_path):
+    path = tmp_path / "job.jsonl"
+    client = FakeClient([["p1"], ["p2"]])
+    client.cursor_error = api_error(429, "rate_limited")
+    checkpoint = Checkpoint(path)
+    checkpoint.start({})
+    checkpoint.record_cursor("c1")
+
+    with pytest.raises(Exception, match="Failed to query database"):
+        BulkUpdater(client).update_query("db", {}, checkpoint=checkpoint)
+    checkpoint.close()
+    assert client.start_cursors == ["c1"]
+    assert Checkpoint(path).cursor == "c1"
@@ -0,0 +1,53 @@
+"""Tests for multi-part upload slicing."""
+
+import mmap
+import os
+
+import pytest
+
+from notion_cli import client
+from notion_cli.client import FileSlice, upload_part_ranges
+
+
+@pytest.fixture
+def mapped(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+
+def test_part_ranges_cover_the_file_without_overlap(monkeypatch):
+    monkeypatch.setattr(client, "UPLOAD_PART_SIZE", 10)
+    assert upload_part_ranges(25) == [(0, 10), (10, 10), (20, 5)]
+    assert upload_part_ranges(20) == [(0, 10), (10, 10)]
+    assert upload_part_ranges(0) == []
+
+
+def test_slices_read_back_the_whole_file(monkeypatch, mapped):
+    monkeypatch.setattr(client, "UPLOAD_PART_SIZE", 300)
+    parts = [
+        FileSlice(mapped, offset, length).read()
+        for offset, length in upload_part_ranges(len(mapped))
+    ]
+    assert [len(part) for part in parts] == [300, 300, 300, 124]
+    assert b"".join(parts) == mapped[:]
+
+
+def test_slice_reads_stop_at_its_end(mapped):
+    part = FileSlice(mapped, 100, 10)
+    assert part.read(4) == mapped[100:104]
+    assert part.read(None) == mapped[104:110]
+    assert part.read() == b""
+    assert part.tell() == 10
+
+
+def test_slice_seek_rewinds_for_a_retried_send(mapped):
+    part = FileSlice(mapped, 1000, 24)
+    assert part.read() == mapped[1000:1024]
+    assert part.seek(0) == 0
+    assert part.read() == mapped[1000:1024]
+    assert part.seek(-4, os.SEEK_END) == 20
+    assert part.read() == mapped[1020:1024]
+    part.seek(2)
+    assert part.seek(3, os.SEEK_CUR) == 5
@@ -0,0 +1,167 @@
+"""Tests for filter compilation, pushdown and inversion."""
+
+from typing import Any
+
+import pytest
+
+from notion_cli.filters import (
+    FilterCompiler,
+    FilterParser,
+    compile_notion_filter,
+    invert_notion_filter,
+)
+
+PROPERTIES = {
+    "Name": {"type": "title"},
+    "Status": {"type": "select"},
+    "Points": {"type": "number"},
+    "Due": {"type": "date"},
+}
+
+
+def entry(name: str, status: str | None, points: float | None) -> dict[str, Any]:
+    return {
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": name}]},
+            "Status": {"type": "select", "select": {"name": status} if status else None},
+            "Points": {"type": "number", "number": points},
+        }
+    }
+
+
+ENTRIES = [
+    entry("Alpha", "Done", 3),
+    entry("Mango", "Todo", 8),
+    entry("Zebra", "Done", None),
+    entry("Yak", None, 1),
+]
+
+
+def compile_filter(expression: str):
+    return FilterCompiler().compile(FilterParser().parse(expression), PROPERTIES)
+
+
+def names(entries) -> list[str]:
+    return [e["properties"]["Name"]["title"][0]["plain_text"] for e in entries]
+
+
+def test_invert_single_conditions():
+    status = {"property": "Status", "select": {"equals": "Done"}}
+    assert invert_notion_filter(status) == {
+        "property": "Status",
+        "select": {"does_not_equal": "Done"},
+    }
+    assert invert_notion_filter({"property": "Points", "number": {"is_empty": True}}) == {
+        "property": "Points",
+        "number": {"is_not_empty": True},
+    }
+
+
+def test_inverted_comparisons_also_match_empty_values():
+    assert invert_notion_filter({"property": "Points", "number": {"greater_than": 5}}) == {
+        "or": [
+            {"property": "Points", "number": {"less_than_or_equal_to": 5}},
+            {"property": "Points", "number": {"is_empty": True}},
+        ]
+    }
+
+
+def test_inverted_date_equality_has_no_does_not_equal():
+    assert invert_notion_filter({"property": "Due", "date": {"equals": "2024-01-01"}}) == {
+        "or": [
+            {"property": "Due", "date": {"before": "2024-01-01"}},
+            {"property": "Due", "date": {"after": "2024-01-01"}},
+            {"property": "Due", "date": {"is_empty": True}},
+        ]
+    }
+
+
+def test_invert_applies_de_morgan():
+    a = {"property": "Status", "select": {"equals": "Done"}}
+    b = {"property": "Name", "title": {"contains": "x"}}
+    assert invert_notion_filter({"and": [a, b]}) == {
+        "or": [invert_notion_filter(a), invert_notion_filter(b)]
+    }
+    assert invert_notion_filter({"or": [a, b]}) == {
+        "and": [invert_notion_filter(a), invert_notion_filter(b)]
+    }
+
+
+@pytest.mark.parametrize(
+    "notion_filter",
+    [
+        {"timestamp": "created_time", "created_time": {"after": "2024-01-01"}},
+        {"property": "Name", "title": {"starts_with": "A"}},
+        {"and": [{"property": "Name", "title": {"starts_with": "A"}}]},
+    ],
+)
+def test_filters_without_exact_inverse(notion_filter):
+    assert invert_notion_filter(notion_filter) is None
+
+
+@pytest.mark.parametrize(
+    "notion_filter",
+    [
+        {"property": "Status", "select": {"equals": "Done"}},
+        {"property": "Points", "number": {"greater_than": 2}},
+        {
+            "or": [
+                {"property": "Points", "number": {"less_than": 2}},
+                {"property": "Status", "select": {"is_empty": True}},
+            ]
+        },
+    ],
+)
+def test_inverse_matches_exactly_the_other_entries(notion_filter):
+    matches = compile_notion_filter(notion_filter)
+    inverse = compile_notion_filter(invert_notion_filter(notion_filter))
+    assert all(matches(e) != inverse(e) for e in ENTRIES)
+
+
+def test_supported_conditions_are_pushed_down_exactly():
+    compiled = compile_filter("Status=Done, Points>2")
+    assert compiled.exact
+    assert compiled.server == {
+        "and": [
+            {"property": "Status", "select": {"equals": "Done"}},
+            {"property": "Points", "number": {"greater_than": 2.0}},
+        ]
+    }
+    assert names(compiled.post_filter(ENTRIES)) == names(ENTRIES)
+    assert names(filter(compiled.predicate, ENTRIES)) == ["Alpha"]
+
+
+def test_and_pushes_down_what_it_can_and_finishes_locally():
+    compiled = compile_filter("Status=Done, Name>M")
+    assert not compiled.exact
+    assert compiled.server == {"property": "Status", "select": {"equals": "Done"}}
+    assert compiled.properties == {"Status", "Name"}
+    assert names(compiled.post_filter(ENTRIES)) == ["Zebra"]
+
+
+def test_or_with_a_local_condition_is_not_pushed_down():
+    compiled = compile_filter("OR(Status=Todo, Name>X)")
+    assert compiled.server is None
+    assert not compiled.exact
+    assert names(compiled.post_filter(ENTRIES)) == ["Mango", "Zebra", "Yak"]
+
+
+def test_not_of_an_exact_filter_is_inverted_on_the_server():
+    compiled = compile_filter("NOT(Status=Done)")
+    assert compiled.exact
+    assert compiled.server == {"property": "Status", "select": {"does_not_equal": "Done"}}
+    assert names(filter(compiled.predicate, ENTRIES)) == ["Mango", "Yak"]
+
+
+def test_not_of_a_local_filter_runs_locally():
+    compiled = compile_filter("NOT(Name>M)")
+    assert compiled.server is None
+    assert not compiled.exact
+    assert names(compiled.post_filter(ENTRIES)) == ["Alpha"]
+
+
+def test_empty_expression_matches_everything():
+    compiled = compile_filter("")
+    assert compiled.server is None
+    assert compiled.exact
+    assert names(compiled.post_filter(ENTRIES)) == names(ENTRIES)
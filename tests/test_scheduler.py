@@ -0,0 +1,123 @@
+"""Tests for rate limiting and retry backoff."""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from notion_client.errors import APIResponseError
+
+from notion_cli import scheduler
+from notion_cli.scheduler import RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    """Stands in for time.monotonic so bucket refills are deterministic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler.time, "monotonic", fake)
+    return fake
+
+
+def api_error(status: int, headers: dict[str, str] | None = None) -> APIResponseError:
+    response = httpx.Response(
+        status, headers=headers, request=httpx.Request("GET", "https://api.notion.com")
+    )
+    return APIResponseError(response=response, message="failed", code="rate_limited")
+
+
+def test_bucket_allows_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Callers beyond the burst queue behind each other at the sustained rate
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_bucket_refills_over_time_up_to_capacity(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock.now += 10
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_without_rate_never_waits(clock):
+    bucket = TokenBucket(rate=0, burst=1)
+    assert all(bucket.reserve() == 0.0 for _ in range(10))
+
+
+def test_pause_holds_back_every_caller(clock):
+    bucket = TokenBucket(rate=10.0, burst=5)
+    bucket.pause(3.0)
+    assert bucket.reserve() == pytest.approx(3.0)
+    clock.now += 1.0
+    assert bucket.reserve() == pytest.approx(2.0)
+    clock.now += 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_retry_after_seconds_is_honored_and_pauses_the_bucket(clock):
+    requests = RequestScheduler(max_delay=30.0)
+    assert requests.retry_delay(api_error(429, {"Retry-After": "7"}), attempt=0) == 7.0
+    assert requests.bucket.reserve() == pytest.approx(7.0)
+
+
+def test_retry_after_is_capped_at_max_delay(clock):
+    requests = RequestScheduler(max_delay=5.0)
+    assert requests.retry_delay(api_error(429, {"Retry-After": "120"}), attempt=0) == 5.0
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(UTC) + timedelta(seconds=20)
+    requests = RequestScheduler(max_delay=60.0)
+    delay = requests.retry_delay(
+        api_error(503, {"Retry-After": format_datetime(retry_at, usegmt=True)}), attempt=0
+    )
+    assert 15 < delay <= 20
+
+
+def test_backoff_without_retry_after_is_jittered_and_bounded(monkeypatch):
+    monkeypatch.setattr(scheduler.random, "uniform", lambda low, high: high)
+    requests = RequestScheduler(base_delay=0.5, max_delay=3.0)
+    delays = [requests.retry_delay(api_error(502), attempt) for attempt in range(4)]
+    assert delays == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_gives_up_on_other_errors_and_after_max_retries():
+    requests = RequestScheduler(max_retries=2)
+    assert requests.retry_delay(api_error(400), attempt=0) is None
+    assert requests.retry_delay(api_error(404), attempt=0) is None
+    assert requests.retry_delay(ValueError("not an HTTP error"), attempt=0) is None
+    assert requests.retry_delay(api_error(429, {"Retry-After": "1"}), attempt=2) is None
+
+
+def test_server_errors_are_not_retried_for_non_idempotent_calls(clock):
+    requests = RequestScheduler()
+    assert requests.retry_delay(api_error(500), 0, retry_server_errors=False) is None
+    assert requests.retry_delay(api_error(429, {"Retry-After": "1"}), 0, False) == 1.0
+
+
+def test_call_retries_until_success(monkeypatch):
+    monkeypatch.setattr(scheduler.time, "sleep", lambda seconds: None)
+    requests = RequestScheduler(requests_per_second=0)
+    outcomes = [api_error(429, {"Retry-After": "0"}), api_error(503), "ok"]
+
+    def flaky() -> str:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert requests.call(flaky) == "ok"
+    assert outcomes == []